@@ -4,13 +4,15 @@ Display: owns pygame display, fonts, overlays, and menu rendering.
 Coordinates all visual output and flip/swap timing.
 """
 import os
+import time
+from typing import Callable
 
 import pygame
 
 from fptv.log import Logger
 from fptv.render import (
     GLMenuRenderer, OverlayManager, init_viewport, clear_screen,
-    make_text_overlay, make_volume_overlay,
+    make_text_overlay, make_volume_overlay, make_rgba_surface,
     draw_main_menu, draw_browse, draw_about, draw_scan,
 )
 from fptv.tuner import Tuner
@@ -20,6 +22,20 @@ ASSETS_FONT = os.path.join(os.path.dirname(os.path.realpath(__file__)), "assets/
 PI_DISPLAY_W = 800
 PI_DISPLAY_H = 480
 
+# Service SDL's event queue at most this often, however often the loop wakes.
+EVENT_PUMP_INTERVAL_S = 1.0 / 60
+
+# SDL events the kiosk never reads (input comes from GPIO). Names rather than
+# constants: WINDOWEVENT is pygame 1 only, the WINDOW* split is pygame 2.
+_BLOCKED_EVENT_NAMES = (
+    "MOUSEMOTION", "MOUSEBUTTONDOWN", "MOUSEBUTTONUP", "MOUSEWHEEL",
+    "ACTIVEEVENT", "VIDEORESIZE", "VIDEOEXPOSE", "WINDOWEVENT",
+    "WINDOWSHOWN", "WINDOWHIDDEN", "WINDOWEXPOSED", "WINDOWMOVED",
+    "WINDOWRESIZED", "WINDOWSIZECHANGED", "WINDOWMINIMIZED", "WINDOWMAXIMIZED",
+    "WINDOWRESTORED", "WINDOWENTER", "WINDOWLEAVE", "WINDOWFOCUSGAINED",
+    "WINDOWFOCUSLOST", "WINDOWTAKEFOCUS", "WINDOWHITTEST",
+)
+
 
 class Display:
     """
@@ -35,12 +51,16 @@ class Display:
         tuner = Tuner(tvh)  # needs GL context from display
         display.set_tuner(tuner)
 
-        # Render different screens:
+        # Render different screens into the backbuffer (menu screens only
+        # redraw when their content changes):
         display.render_main_menu(items, selected)
         display.render_browse(channels, selected)
         display.render_about(info)
         display.render_video(force_flip)
 
+        # Once per loop iteration; flips only if something was drawn:
+        display.present()
+
         # Overlays:
         display.show_channel_name("PBS", seconds=3.0)
         display.show_volume(75)
@@ -49,13 +69,17 @@ class Display:
     def __init__(self, fullscreen: bool = True):
         self._tuner: Tuner | None = None
         self._log = Logger("display")
+        self._last_pump = 0.0
+        self._menu_key: tuple | None = None  # Content last drawn into the menu texture
+        self._menu_on_screen = False  # False once anything else has been drawn
+        self._viewport_size: tuple[int, int] | None = None  # Last size passed to glViewport
+        self._needs_present = False  # Backbuffer holds a frame not yet flipped
 
         self._initialize(fullscreen)
 
     def _initialize(self, fullscreen: bool) -> None:
         """Initialize pygame display, fonts, and renderers."""
-        pygame.init()
-        pygame.font.init()
+        pygame.init()  # Also initializes pygame.font
 
         if fullscreen:
             pygame.display.set_mode((0, 0), pygame.OPENGL | pygame.DOUBLEBUF | pygame.FULLSCREEN)
@@ -64,6 +88,11 @@ class Display:
 
         pygame.mouse.set_visible(False)
 
+        # Input comes from GPIO, not SDL. Drop pointer/window events at the source
+        # so SDL doesn't allocate and queue events nobody reads.
+        blocked = [getattr(pygame, name, None) for name in _BLOCKED_EVENT_NAMES]
+        pygame.event.set_blocked([ev for ev in blocked if ev is not None])
+
         self.w, self.h = pygame.display.get_surface().get_size()
         self._log.out(f"SDL driver: {pygame.display.get_driver()} size={self.w}x{self.h}")
 
@@ -83,8 +112,9 @@ class Display:
             make_volume=make_volume_overlay,
         )
 
-        # Menu surface (reused each frame)
-        self._menu_surface = pygame.Surface((self.w, self.h))
+        # Menu surface (reused each frame). Laid out in GL_RGBA byte order so the
+        # texture upload reads its pixels in place, with no conversion or copy.
+        self._menu_surface = make_rgba_surface(self.w, self.h)
 
         self._log.out("Display initialized")
 
@@ -96,85 +126,141 @@ class Display:
     # Rendering
     # -------------------------------------------------------------------------
 
-    def render_video(self, force_flip: bool = False) -> tuple[bool, bool]:
+    def render_video(self, force_flip: bool = False, now: float | None = None) -> tuple[bool, bool]:
         """
         Render video frame with overlays.
 
         Args:
             force_flip: Force a flip even if no new video frame
+            now: Frame timestamp from time.monotonic(); read here if omitted
 
         Returns:
-            (did_flip, did_render_frame) tuple.
-            - did_flip: True if pygame.display.flip() was called
+            (did_draw, did_render_frame) tuple.
+            - did_draw: True if a frame was composited for present()
             - did_render_frame: True if mpv rendered a new video frame
         """
-        init_viewport(self.w, self.h)
-        clear_screen()
+        self._menu_on_screen = False
+        self._ensure_viewport()
 
-        # Render video frame
+        # Render video frame. mpv fills the whole framebuffer (letterbox bars
+        # included), so the backbuffer only needs clearing when it didn't draw.
         did_render = self._tuner.render_frame(self.w, self.h)
 
-        # Tick and draw overlays
-        self._overlays.tick()
+        # Expire timed overlays (only when one is due)
+        if now is None:
+            now = time.monotonic()
+        if now >= self._overlays.next_expiry:
+            self._overlays.tick(now)
+
+        # Nothing to present: skip compositing a frame that would never be shown
+        if not (did_render or force_flip):
+            return False, False
+
+        if not did_render:
+            clear_screen()
         self._overlays.draw()
+        self._needs_present = True
+        return True, did_render
+
+    def render_main_menu(self, items: list[str], selected: int) -> bool:
+        """Render main menu screen with selectable options. Returns True if drawn."""
+        return self._render_menu(
+            ("menu", items, selected),
+            lambda: draw_main_menu(self._menu_surface, self._font_title, self._font_item, items, selected),
+        )
 
-        # Present if we have new content
-        if did_render or force_flip:
-            pygame.display.flip()
-            self._tuner.report_swap()
-            return True, did_render
+    def render_browse(self, channels: list, selected: int, channel_epg: list = None, loading: bool = False,
+                      error: str | None = None) -> bool:
+        """
+        Render channel browser screen with optional EPG (now playing) info. Returns True if drawn.
 
-        return False, did_render
+        channel_epg holds each channel's current EPGEvent (or None), index-aligned with channels.
+        error, if set, says why the playlist fetch failed; it replaces "Loading…" while the fetch
+        is retried, and "No channels found" once it has given up.
+        """
+        return self._render_menu(
+            ("browse", channels, selected, channel_epg, loading, error),
+            lambda: draw_browse(self._menu_surface, self._font_item, channels, selected, channel_epg,
+                                self._font_small, loading=loading, error=error),
+        )
 
-    def render_main_menu(self, items: list[str], selected: int) -> None:
-        """Render main menu screen with selectable options."""
-        init_viewport(self.w, self.h)
+    def render_about(self, info: dict[str, str], selected: int = 0) -> bool:
+        """Render about screen with device info. selected=-1 means Back. Returns True if drawn."""
+        return self._render_menu(
+            ("about", info, selected),
+            lambda: draw_about(self._menu_surface, self._font_title, self._font_item, info,
+                               back_selected=(selected == -1)),
+        )
 
-        draw_main_menu(self._menu_surface, self._font_title, self._font_item, items, selected)
-        self._renderer.update_from_surface(self._menu_surface)
+    def render_scan(self, status: str = "Not implemented yet", selected: int = 0) -> bool:
+        """Render scan screen (placeholder). selected=-1 means Back. Returns True if drawn."""
+        return self._render_menu(
+            ("scan", status, selected),
+            lambda: draw_scan(self._menu_surface, self._font_title, self._font_item, status,
+                              back_selected=(selected == -1)),
+        )
 
-        clear_screen()
-        self._renderer.draw_fullscreen()
-        pygame.display.flip()
-        self._tuner.report_swap()
+    def _ensure_viewport(self) -> None:
+        """Issue glViewport only when the surface size changed (it's fixed after set_mode)."""
+        size = (self.w, self.h)
+        if size != self._viewport_size:
+            init_viewport(self.w, self.h)
+            self._viewport_size = size
 
-    def render_browse(self, channels: list, selected: int, epg_map: dict = None) -> None:
-        """Render channel browser screen with optional EPG (now playing) info."""
-        init_viewport(self.w, self.h)
+    def _render_menu(self, key: tuple, draw: Callable[[], None]) -> bool:
+        """
+        Draw a menu screen for present(), skipping all work if it is already on screen.
 
-        draw_browse(self._menu_surface, self._font_item, channels, selected, epg_map, self._font_small)
-        self._renderer.update_from_surface(self._menu_surface)
+        The menu surface is redrawn and re-uploaded only when the content key
+        changes. Keys hold the drawn objects themselves; tuple comparison
+        short-circuits on identity, so an unchanged channel or EPG list costs a
+        pointer compare. The draw is skipped too unless video has been drawn since.
+        """
+        if key == self._menu_key:
+            if self._menu_on_screen:
+                return False
+        else:
+            draw()
+            self._renderer.update_from_surface(self._menu_surface)
+            self._menu_key = key
 
+        self._ensure_viewport()
         clear_screen()
         self._renderer.draw_fullscreen()
-        pygame.display.flip()
-        self._tuner.report_swap()
+        self._needs_present = True
+        self._menu_on_screen = True
+        return True
 
-    def render_about(self, info: dict[str, str], selected: int = 0) -> None:
-        """Render about screen with device info. selected=-1 means Back."""
-        init_viewport(self.w, self.h)
-
-        draw_about(self._menu_surface, self._font_title, self._font_item, info,
-                   back_selected=(selected == -1))
-        self._renderer.update_from_surface(self._menu_surface)
+    def present(self) -> bool:
+        """
+        Flip the backbuffer if a render_* call drew into it since the last present.
 
-        clear_screen()
-        self._renderer.draw_fullscreen()
+        Call once at the end of each loop iteration. Returns True if it flipped.
+        """
+        if not self._needs_present:
+            return False
+        self._needs_present = False
         pygame.display.flip()
         self._tuner.report_swap()
+        return True
 
-    def render_scan(self, status: str = "Not implemented yet", selected: int = 0) -> None:
-        """Render scan screen (placeholder). selected=-1 means Back."""
-        init_viewport(self.w, self.h)
+    def pump_events(self) -> bool:
+        """
+        Drain SDL's event queue, at most once per frame period.
 
-        draw_scan(self._menu_surface, self._font_title, self._font_item, status,
-                  back_selected=(selected == -1))
-        self._renderer.update_from_surface(self._menu_surface)
+        Input comes from GPIO, but SDL still needs servicing to stay responsive.
+        The whole queue is taken in one pygame.event.get() call rather than
+        polled an event at a time. The loop may wake more often than once per
+        frame (input, early wakeups); those extra wakeups skip the drain.
 
-        clear_screen()
-        self._renderer.draw_fullscreen()
-        pygame.display.flip()
-        self._tuner.report_swap()
+        Returns:
+            True if SDL delivered a QUIT (e.g. SIGINT/SIGTERM).
+        """
+        now = time.monotonic()
+        if now - self._last_pump < EVENT_PUMP_INTERVAL_S:
+            return False
+        self._last_pump = now
+        return any(ev.type == pygame.QUIT for ev in pygame.event.get())
 
     # -------------------------------------------------------------------------
     # Overlays
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
-class Event(Enum):
+class Event(IntEnum):
     ROT_R = auto()
     ROT_L = auto()
     PRESS = auto()  # select/back button
@@ -6,6 +6,12 @@ from ctypes.util import find_library
 
 def _load_gl():
     # On Pi/KMS this is often GLESv2; fallback to desktop GL.
+    # Try the usual sonames directly; find_library() shells out to ldconfig/gcc.
+    for path in ("libGLESv2.so.2", "libGL.so.1"):
+        try:
+            return ctypes.CDLL(path)
+        except OSError:
+            pass
     for name in ("GLESv2", "GL"):
         path = find_library(name)
         if path:
@@ -2,12 +2,13 @@
 
 import time
 from dataclasses import dataclass
-from queue import SimpleQueue, Empty
+from queue import Empty
 from typing import Tuple, Callable
 
 from gpiozero import RotaryEncoder, Button, Device
 
 from fptv.event import Event, HwEvent
+from fptv.inputqueue import InputQueue
 
 GPIO_ENC_CHANNEL_A = 17  # pin 11
 GPIO_ENC_CHANNEL_B = 27  # pin 13
@@ -46,7 +47,7 @@ LONG_PRESS_S = 5.0
 _press_t0 = 0
 
 
-def _setup_encoder(name: str, gpios: RotaryEncoderGPIOs, q: SimpleQueue) -> Tuple[RotaryEncoder, Button]:
+def _setup_encoder(name: str, gpios: RotaryEncoderGPIOs, q: InputQueue) -> Tuple[RotaryEncoder, Button]:
     enc = RotaryEncoder(gpios.gpio_rot_a, gpios.gpio_rot_b, bounce_time=0.002)
     if gpios.gpio_button is None:
         btn = EmptyButton()
@@ -63,14 +64,14 @@ def _setup_encoder(name: str, gpios: RotaryEncoderGPIOs, q: SimpleQueue) -> Tupl
             return
         last = cur
         if d > 0:
-            q.put(HwEvent(name, Event.ROT_R))
+            q.put_nowait(HwEvent(name, Event.ROT_R))
         else:
-            q.put(HwEvent(name, Event.ROT_L))
+            q.put_nowait(HwEvent(name, Event.ROT_L))
 
     def on_pressed():
         global _press_t0
         _press_t0 = time.monotonic()
-        q.put(HwEvent(name, Event.PRESS))
+        q.put_nowait(HwEvent(name, Event.PRESS))
 
     def on_released():
         global _press_t0
@@ -78,9 +79,9 @@ def _setup_encoder(name: str, gpios: RotaryEncoderGPIOs, q: SimpleQueue) -> Tupl
         _press_t0 = time.monotonic()
 
         if delta_t > LONG_PRESS_S:
-            q.put(HwEvent(name, Event.LONG_PRESS))
+            q.put_nowait(HwEvent(name, Event.LONG_PRESS))
         else:
-            q.put(HwEvent(name, Event.RELEASE))
+            q.put_nowait(HwEvent(name, Event.RELEASE))
 
     enc.when_rotated = on_rotated
     btn.when_pressed = on_pressed
@@ -90,7 +91,7 @@ def _setup_encoder(name: str, gpios: RotaryEncoderGPIOs, q: SimpleQueue) -> Tupl
 
 
 class HwEventBinding:
-    def __init__(self, q: SimpleQueue):
+    def __init__(self, q: InputQueue):
         self.q = q
 
         # Channel selection (end); Mode selection (btn).
@@ -108,7 +109,7 @@ class HwEventBinding:
 
 
 if __name__ == '__main__':
-    q = SimpleQueue()
+    q = InputQueue()
     hw = HwEventBinding(q)
 
     try:
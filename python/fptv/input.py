@@ -2,11 +2,11 @@
 Input handling: translates raw hardware events to semantic actions.
 """
 from enum import Enum, auto
-from queue import SimpleQueue, Empty
 from typing import Iterator
 
 from fptv.event import Event, HwEvent
 from fptv.hw import ENCODER_CHANNEL_NAME, ENCODER_VOLUME_NAME
+from fptv.inputqueue import InputQueue
 
 
 class Action(Enum):
@@ -21,29 +21,26 @@ class Action(Enum):
     @staticmethod
     def from_event(hw_event: HwEvent) -> "Action | None":
         """Translate a single HwEvent to an Action (or None if not relevant)."""
-        ev = hw_event.event
-        src = hw_event.source
+        action = _EVENT_ACTIONS.get(hw_event.event)
+        if action is None:
+            action = _ROTARY_ACTIONS.get((hw_event.event, hw_event.source))
+        # Other events (RELEASE, LONG_PRESS, etc.) map to None
+        return action
 
-        if ev == Event.QUIT:
-            return Action.QUIT
 
-        if ev == Event.PRESS:
-            return Action.TOGGLE_MODE
+# Events that mean the same thing regardless of which encoder sent them.
+_EVENT_ACTIONS: dict[Event, Action] = {
+    Event.QUIT: Action.QUIT,
+    Event.PRESS: Action.TOGGLE_MODE,
+}
 
-        if ev == Event.ROT_R:
-            if src == ENCODER_CHANNEL_NAME:
-                return Action.NEXT_CHANNEL
-            elif src == ENCODER_VOLUME_NAME:
-                return Action.VOLUME_UP
-
-        if ev == Event.ROT_L:
-            if src == ENCODER_CHANNEL_NAME:
-                return Action.PREV_CHANNEL
-            elif src == ENCODER_VOLUME_NAME:
-                return Action.VOLUME_DOWN
-
-        # Ignore other events (RELEASE, LONG_PRESS, etc.)
-        return None
+# Rotation depends on the source encoder.
+_ROTARY_ACTIONS: dict[tuple[Event, str], Action] = {
+    (Event.ROT_R, ENCODER_CHANNEL_NAME): Action.NEXT_CHANNEL,
+    (Event.ROT_L, ENCODER_CHANNEL_NAME): Action.PREV_CHANNEL,
+    (Event.ROT_R, ENCODER_VOLUME_NAME): Action.VOLUME_UP,
+    (Event.ROT_L, ENCODER_VOLUME_NAME): Action.VOLUME_DOWN,
+}
 
 
 class InputMapper:
@@ -59,9 +56,22 @@ class InputMapper:
                 ...
     """
 
-    def __init__(self, event_queue: SimpleQueue):
+    def __init__(self, event_queue: InputQueue):
         self._queue = event_queue
 
+    def wait(self, timeout: float) -> bool:
+        """
+        Block until a hardware event is queued, wake() is called, or the timeout elapses.
+
+        Returns:
+            True if there is something to handle (events for poll(), or a wake), False on timeout.
+        """
+        return self._queue.wait(timeout)
+
+    def wake(self) -> None:
+        """Interrupt a wait() from another thread (e.g. when background work completes)."""
+        self._queue.wake()
+
     def poll(self) -> Iterator[Action]:
         """
         Drain the event queue and yield semantic actions.
@@ -69,12 +79,11 @@ class InputMapper:
         Yields:
             Action for each relevant hardware event.
         """
-        while True:
-            try:
-                hw_event: HwEvent = self._queue.get_nowait()
-            except Empty:
-                break
-
-            action = Action.from_event(hw_event)
+        # Only this thread consumes, so qsize() can only grow underneath us; taking
+        # exactly that many never hits Empty.
+        get = self._queue.get_nowait
+        from_event = Action.from_event
+        for _ in range(self._queue.qsize()):
+            action = from_event(get())
             if action is not None:
                 yield action
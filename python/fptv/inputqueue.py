@@ -0,0 +1,73 @@
+"""
+Single-consumer bounded queue for hardware events.
+"""
+import threading
+from collections import deque
+from queue import Empty
+from typing import Any
+
+
+class InputQueue:
+    """
+    Bounded deque with a blocking wait() for a single consumer.
+
+    Drop-in for the parts of SimpleQueue the kiosk uses: put_nowait() and
+    get_nowait(), plus wait()/wake() so the consumer can sleep until there is
+    something to do.
+
+    Any number of threads may produce: gpiozero may deliver callbacks for
+    different encoders on different threads, and background loaders call wake().
+    deque.append and deque.popleft are atomic in CPython; the condition lock only
+    guards the sleep/wake handshake, so a put() or wake() can't slip in between
+    the consumer's check and its wait and go unnoticed. When full, a put evicts
+    the oldest item, so a stalled consumer sees the most recent input rather than
+    a stale backlog.
+
+    Only one thread may consume.
+    """
+
+    def __init__(self, capacity: int = 256):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive: {capacity}")
+        self._items: deque[Any] = deque(maxlen=capacity)
+        self._cond = threading.Condition(threading.Lock())
+        self._woken = False  # wake() called since the last wait()
+
+    def put_nowait(self, item: Any) -> None:
+        """Append an item, dropping the oldest one if the queue is full."""
+        with self._cond:
+            self._items.append(item)
+            self._cond.notify()
+
+    def get_nowait(self) -> Any:
+        """Pop the oldest item. Raises queue.Empty if there is none."""
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise Empty from None
+
+    def wake(self) -> None:
+        """Make the consumer's current or next wait() return True without queuing anything."""
+        with self._cond:
+            self._woken = True
+            self._cond.notify()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Block until an item is queued or wake() is called, up to timeout seconds.
+
+        Returns:
+            True if items are ready or wake() was called, False on timeout.
+        """
+        with self._cond:
+            if not self._items and not self._woken:
+                self._cond.wait(timeout)
+            ready = self._woken or bool(self._items)
+            self._woken = False
+            return ready
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
@@ -1,20 +1,25 @@
 #!/usr/bin/env python3
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from queue import SimpleQueue
+from enum import IntEnum, auto
+from functools import partial
+from typing import Callable
 
-import pygame
+import requests
 
 from fptv.display import Display
 from fptv.hw import HwEventBinding
 from fptv.input import Action, InputMapper
+from fptv.inputqueue import InputQueue
 from fptv.log import Logger
+from fptv.pacer import FramePacer
 from fptv.tuner import Tuner, TunerState
 from fptv.tvh import Channel, EPGEvent, TVHeadendScanner, ScanConfig
 
 
-class Screen(Enum):
+class Screen(IntEnum):
     MENU = auto()  # Main menu: Browse, Scan, About
     BROWSE = auto()  # Channel list
     TUNE = auto()  # Tuning in progress
@@ -26,9 +31,25 @@ class Screen(Enum):
 # Main menu options
 MENU_OPTIONS = ["Browse", "Scan", "About"]
 
+FPS = 60
+
 VOLUME_INCREMENT = 5
 VOLUME_DECREMENT = -5
 
+# Hardware event queue size. At 60 Hz a full queue is ~1 s of continuous spinning;
+# beyond that the input is stale anyway and the oldest events are dropped.
+EVENT_QUEUE_CAPACITY = 64
+
+# Menu screens are static between inputs and scheduled work (EPG refresh); they
+# block until one of those instead of waking at the frame rate. Background loaders
+# wake the wait directly; this cap is only a backstop.
+MENU_IDLE_MAX_WAIT_S = 1.0
+
+# Playlist fetch retry backoff (seconds): TVHeadend or the network may not be up yet
+# at boot. Doubles after each failure up to the max; retries until it succeeds.
+CHANNELS_RETRY_MIN_S = 2.0
+CHANNELS_RETRY_MAX_S = 30.0
+
 # EPG refresh interval (seconds) - fetch "now playing" data periodically on Browse screen
 EPG_REFRESH_SECS = 60.0
 
@@ -41,10 +62,13 @@ class State:
     about_index: int = 0  # About screen (-1 = Back, 0 = content)
     scan_index: int = 0  # Scan screen (-1 = Back, 0 = content)
     channels: list[Channel] | None = None
+    channels_loaded: bool = False  # False until the background playlist fetch completes
+    channels_error: str | None = None  # Why the last playlist fetch failed, if it did
 
     # EPG (now playing) data
     epg_map: dict[str, EPGEvent] = field(default_factory=dict)
-    epg_fetched_at: float = 0.0
+    channel_epg: list[EPGEvent | None] = field(default_factory=list)  # epg_map lookup per channel, by index
+    next_epg_refresh: float = 0.0  # time.monotonic() deadline; 0 = fetch on first Browse
 
     def __post_init__(self):
         if self.channels is None:
@@ -61,11 +85,23 @@ class State:
 class FPTV:
     def __init__(self):
         self.log = Logger("fptv")
-        self._event_queue = SimpleQueue()
+        self._event_queue = InputQueue(EVENT_QUEUE_CAPACITY)
         self.tvh = TVHeadendScanner(ScanConfig.from_env())
         self.hw = HwEventBinding(self._event_queue)
         self.input = InputMapper(self._event_queue)
-        self.state = State(channels=self.tvh.get_playlist_channels())
+        self.state = State()
+
+        # Fetch the playlist in the background so the HTTP round-trip overlaps
+        # pygame/mpv init. Results land in a one-slot mailbox (latest wins): either
+        # (channels, None) on success or (None, message) after a failed attempt.
+        self._mailbox_lock = threading.Lock()
+        self._channels_mailbox: tuple[list[Channel] | None, str | None] | None = None
+        self._stop_loading = threading.Event()  # Ends the loader's retry backoff early
+        threading.Thread(target=self._load_channels, name="fptv-channels", daemon=True).start()
+
+        # EPG refreshes run on a worker so a slow TVHeadend never stalls the UI.
+        self._epg_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fptv-epg")
+        self._epg_future: Future | None = None
 
         # Display (owns pygame, fonts, overlays, menu renderer)
         self.display = Display()
@@ -74,52 +110,92 @@ class FPTV:
         self.tuner = Tuner(self.tvh)
         self.display.set_tuner(self.tuner)
 
-    def mainloop(self) -> None:
-        self.log.out(f"Loaded {len(self.state.channels)} channels")
+        # Frame pacing (replaces pygame.time.Clock); kept across mainloop re-entry
+        self._pacer = FramePacer(FPS)
+
+        # Action dispatch table. Handlers return True if the screen needs a flip.
+        self._running = False
+        self._wheel_delta = 0  # Rotation accumulated during one input drain
+        self._volume_delta = 0
+        self._action_handlers: dict[Action, Callable[[], bool]] = {
+            Action.QUIT: self._on_quit,
+            Action.TOGGLE_MODE: self._on_toggle_mode,
+            Action.NEXT_CHANNEL: partial(self._on_wheel, 1),
+            Action.PREV_CHANNEL: partial(self._on_wheel, -1),
+            Action.VOLUME_UP: partial(self._on_volume, VOLUME_INCREMENT),
+            Action.VOLUME_DOWN: partial(self._on_volume, VOLUME_DECREMENT),
+        }
 
-        force_flip = False
-        running = True
-        clock = pygame.time.Clock()
+        # Per-screen dispatch tables (PLAY and TUNE share the video handlers)
+        self._button_handlers: dict[Screen, Callable[[], None]] = {
+            Screen.MENU: self._press_menu,
+            Screen.BROWSE: self._press_browse,
+            Screen.PLAY: self._press_video,
+            Screen.TUNE: self._press_video,
+            Screen.ABOUT: self._press_about,
+            Screen.SCAN: self._press_scan,
+        }
+        self._wheel_handlers: dict[Screen, Callable[[int], None]] = {
+            Screen.MENU: self._wheel_menu,
+            Screen.BROWSE: self._wheel_browse,
+            Screen.PLAY: self._wheel_video,
+            Screen.TUNE: self._wheel_video,
+            Screen.ABOUT: self._wheel_about,
+            Screen.SCAN: self._wheel_scan,
+        }
+        self._menu_renderers: dict[Screen, Callable[[], None]] = {
+            Screen.MENU: self._render_main_menu,
+            Screen.BROWSE: self._render_browse,
+            Screen.ABOUT: self._render_about,
+            Screen.SCAN: self._render_scan,
+        }
 
-        while running:
-            clock.tick(60)
+    def mainloop(self) -> None:
+        # Set whenever input or a background result changes what's on screen. Video
+        # screens flip on it even without a new frame; menu screens only render
+        # when it's set. Starts True so the first frame paints.
+        force_flip = True
+        self._running = True
+
+        # Each iteration: input -> state update -> render -> wait. Input that wakes
+        # the wait is handled and drawn immediately, not a frame later.
+        while self._running:
+            if self.display.pump_events():
+                self._running = False
+                break
+
+            # --- Apply background load results ---
+            # Only menus show them; forcing a flip during playback with no new
+            # video frame would flash a cleared (black) frame.
+            if self._process_loaded() and self.state.screen not in (Screen.PLAY, Screen.TUNE):
+                force_flip = True
 
             # --- Handle input actions ---
             for action in self.input.poll():
-                if action == Action.QUIT:
-                    running = False
-
-                elif action == Action.TOGGLE_MODE:
-                    self._handle_button_press()
-                    force_flip = True
-
-                elif action in (Action.NEXT_CHANNEL, Action.PREV_CHANNEL):
-                    delta = 1 if action == Action.NEXT_CHANNEL else -1
-                    self._handle_wheel(delta)
+                handler = self._action_handlers.get(action)
+                if handler and handler():
                     force_flip = True
+            self._flush_rotation()
 
-                elif action == Action.VOLUME_UP:
-                    self.tuner.add_volume(VOLUME_INCREMENT)
-
-                elif action == Action.VOLUME_DOWN:
-                    self.tuner.add_volume(VOLUME_DECREMENT)
+            # One timestamp for everything this frame
+            now = time.monotonic()
 
             # --- Render ---
             if self.state.screen in (Screen.PLAY, Screen.TUNE):
                 # Render video + overlays
-                did_flip, did_render = self.display.render_video(force_flip)
-                if did_flip:
+                did_draw, did_render = self.display.render_video(force_flip, now)
+                if did_draw:
                     force_flip = False
 
                 # Tick tuner state machine
-                tune_status = self.tuner.tick(did_render)
+                tune_status = self.tuner.tick(did_render, now)
 
                 # Update screen based on tuner state
-                if tune_status.state == TunerState.PLAYING:
+                if tune_status.state is TunerState.PLAYING:
                     self.state.screen = Screen.PLAY
-                elif tune_status.state == TunerState.TUNING:
+                elif tune_status.state is TunerState.TUNING:
                     self.state.screen = Screen.TUNE
-                elif tune_status.state == TunerState.FAILED:
+                elif tune_status.state is TunerState.FAILED:
                     self.display.show_channel_name("No signal", seconds=3.0)
                     self.tuner.pause()
                     self.state.screen = Screen.BROWSE
@@ -131,112 +207,255 @@ class FPTV:
                     self.display.show_channel_name(tune_status.message, seconds=seconds)
                     force_flip = True
 
-            elif self.state.screen == Screen.MENU:
-                self.display.render_main_menu(MENU_OPTIONS, self.state.menu_index)
-
-            elif self.state.screen == Screen.BROWSE:
-                # Refresh EPG data periodically
-                if time.time() - self.state.epg_fetched_at > EPG_REFRESH_SECS:
-                    self.state.epg_map = self.tvh.get_epg_now()
-                    self.state.epg_fetched_at = time.time()
+            else:
+                if self.state.screen is Screen.BROWSE:
+                    self._maybe_refresh_epg(now)
 
-                self.display.render_browse(
-                    self.state.channels,
-                    self.state.browse_index,
-                    self.state.epg_map,
-                )
+                # Menu screens are static until input or a background result
+                if force_flip:
+                    self._render_menu_screen()
+                    force_flip = False
 
-            elif self.state.screen == Screen.ABOUT:
-                self.display.render_about(self._get_about_info(), self.state.about_index)
+            # --- Present (single flip per iteration, only if something was drawn) ---
+            self.display.present()
 
-            elif self.state.screen == Screen.SCAN:
-                self.display.render_scan("Not implemented yet", self.state.scan_index)
+            # --- Wait ---
+            # Until the next frame (or, on menu screens, the next deadline), waking
+            # early if input arrives. A menu screen with a redraw still pending
+            # (e.g. a failed tune just switched to Browse) goes straight round.
+            if self.state.screen in (Screen.PLAY, Screen.TUNE):
+                self._pacer.wait(self.input.wait)
+            elif not force_flip:
+                self.input.wait(self._idle_timeout())
 
         self.shutdown()
 
+    def _render_menu_screen(self) -> None:
+        """Render whichever non-video screen is current."""
+        render = self._menu_renderers.get(self.state.screen)
+        if render:
+            render()
+
+    def _render_main_menu(self) -> None:
+        self.display.render_main_menu(MENU_OPTIONS, self.state.menu_index)
+
+    def _render_browse(self) -> None:
+        self.display.render_browse(
+            self.state.channels,
+            self.state.browse_index,
+            self.state.channel_epg,
+            loading=not self.state.channels_loaded,
+            error=self.state.channels_error,
+        )
+
+    def _render_about(self) -> None:
+        self.display.render_about(self._get_about_info(), self.state.about_index)
+
+    def _render_scan(self) -> None:
+        self.display.render_scan("Not implemented yet", self.state.scan_index)
+
+    def _maybe_refresh_epg(self, now: float) -> None:
+        """Start a background EPG fetch if one is due; _process_loaded swaps it in."""
+        if self._epg_future is None and now >= self.state.next_epg_refresh:
+            self._epg_future = self._epg_pool.submit(self.tvh.get_epg_now)
+            self._epg_future.add_done_callback(lambda _: self.input.wake())
+
+    def _idle_timeout(self) -> float:
+        """Seconds a menu screen can block for input before scheduled work is due."""
+        timeout = MENU_IDLE_MAX_WAIT_S
+        if self.state.screen is Screen.BROWSE and self._epg_future is None:
+            epg_due = self.state.next_epg_refresh - time.monotonic()
+            timeout = min(timeout, epg_due)
+        return max(0.0, timeout)
+
+    def _load_channels(self) -> None:
+        """
+        Background thread: fetch the channel playlist from TVHeadend.
+
+        Retries with backoff while TVHeadend can't be reached, posting each failure
+        so Browse can show it; the channel list stays "loading" meanwhile. A
+        malformed playlist won't fix itself on retry, so that is posted as final.
+        """
+        delay = CHANNELS_RETRY_MIN_S
+        while True:
+            try:
+                channels = self.tvh.fetch_playlist_channels()
+            except requests.exceptions.RequestException as e:
+                self.log.err(f"Failed to load channels (retrying in {delay:.0f}s): {e}")
+                self._post_channels((None, "Can't reach TVHeadend"))
+                if self._stop_loading.wait(delay):
+                    return
+                delay = min(delay * 2, CHANNELS_RETRY_MAX_S)
+                continue
+            except ValueError as e:
+                self.log.err(f"Bad channel playlist: {e}")
+                self._post_channels(([], "Bad channel list from TVHeadend"))
+                return
+            self._post_channels((channels, None))
+            return
+
+    def _post_channels(self, result: tuple[list[Channel] | None, str | None]) -> None:
+        with self._mailbox_lock:
+            self._channels_mailbox = result
+        self.input.wake()
+
+    def _process_loaded(self) -> bool:
+        """Apply results from background loaders. Returns True if state changed."""
+        changed = False
+
+        if self._channels_mailbox is not None:  # Unlocked peek; usually None
+            with self._mailbox_lock:
+                (channels, error), self._channels_mailbox = self._channels_mailbox, None
+            if channels is not None:
+                self.state.channels = channels
+                self.state.channels_loaded = True
+                self.log.out(f"Loaded {len(channels)} channels")
+            self.state.channels_error = error
+            changed = True
+
+        fut = self._epg_future
+        if fut is not None and fut.done():
+            self._epg_future = None
+            try:
+                self.state.epg_map = fut.result()
+            except Exception as e:
+                self.log.err(f"EPG refresh failed: {e}")
+            self.state.next_epg_refresh = time.monotonic() + EPG_REFRESH_SECS
+            changed = True
+
+        if changed:
+            # Resolve each channel's current program once per swap, not per row per draw.
+            # EPG map is keyed by channel name (not UUID).
+            epg_get = self.state.epg_map.get
+            self.state.channel_epg = [epg_get(ch.name) for ch in self.state.channels]
+
+        return changed
+
+    # -------------------------------------------------------------------------
+    # Action handlers
+    # -------------------------------------------------------------------------
+
+    def _on_quit(self) -> bool:
+        self._running = False
+        return False
+
+    def _on_toggle_mode(self) -> bool:
+        # Apply rotation queued ahead of the press so it acts on the right item.
+        self._flush_wheel()
+        self._handle_button_press()
+        return True
+
+    def _on_wheel(self, delta: int) -> bool:
+        self._wheel_delta += delta
+        return True
+
+    def _on_volume(self, delta: int) -> bool:
+        self._volume_delta += delta
+        return False
+
+    def _flush_rotation(self) -> None:
+        """Apply encoder rotation accumulated during an input drain in one step."""
+        self._flush_wheel()
+        if self._volume_delta:
+            self.tuner.add_volume(self._volume_delta)
+            self._volume_delta = 0
+
+    def _flush_wheel(self) -> None:
+        if self._wheel_delta:
+            delta, self._wheel_delta = self._wheel_delta, 0
+            self._handle_wheel(delta)
+
     def _handle_button_press(self) -> None:
         """Handle button press based on current screen."""
-        screen = self.state.screen
-
-        if screen == Screen.MENU:
-            # Select menu option
-            option = MENU_OPTIONS[self.state.menu_index]
-            if option == "Browse":
-                self.state.screen = Screen.BROWSE
-            elif option == "Scan":
-                self.state.screen = Screen.SCAN
-            elif option == "About":
-                self.state.screen = Screen.ABOUT
-
-        elif screen == Screen.BROWSE:
-            if self.state.browse_index == -1:
-                # Back button selected - return to main menu
-                self.state.screen = Screen.MENU
-                self.state.browse_index = 0  # Reset for next time
-            else:
-                # Play selected channel
-                ch = self.state.current_channel
-                if ch:
-                    self.tuner.resume()
-                    self.tuner.tune_now(ch.url, ch.name)
-                    self.display.show_channel_name(ch.name, seconds=3.0)
-                    self.state.screen = Screen.TUNE
-
-        elif screen in (Screen.PLAY, Screen.TUNE):
-            # Return to browse (at current channel position)
-            self.tuner.cancel()
-            self.tuner.pause()
-            self.state.screen = Screen.BROWSE
-
-        elif screen == Screen.ABOUT:
-            if self.state.about_index == -1:
-                # Back button selected
-                self.state.screen = Screen.MENU
-                self.state.about_index = 0  # Reset for next time
-
-        elif screen == Screen.SCAN:
-            if self.state.scan_index == -1:
-                # Back button selected
-                self.state.screen = Screen.MENU
-                self.state.scan_index = 0  # Reset for next time
+        handler = self._button_handlers.get(self.state.screen)
+        if handler:
+            handler()
 
     def _handle_wheel(self, delta: int) -> None:
         """Handle wheel rotation based on current screen."""
-        screen = self.state.screen
-
-        if screen == Screen.MENU:
-            # Navigate menu
-            i = self.state.menu_index + delta
-            self.state.menu_index = max(0, min(len(MENU_OPTIONS) - 1, i))
-
-        elif screen == Screen.BROWSE:
-            # Navigate channel list (-1 = Back button)
-            if self.state.channels:
-                i = self.state.browse_index + delta
-                self.state.browse_index = max(-1, min(len(self.state.channels) - 1, i))
-            else:
-                # No channels - only Back button is available
-                self.state.browse_index = -1
-
-        elif screen in (Screen.PLAY, Screen.TUNE):
-            # Change channel (debounced)
-            if self.state.channels:
-                i = self.state.browse_index + delta
-                self.state.browse_index = max(0, min(len(self.state.channels) - 1, i))
-                ch = self.state.current_channel
-                if ch:
-                    self.display.show_channel_name(ch.name, seconds=3.0)
-                    self.tuner.request_tune(ch.url, ch.name)
-
-        elif screen == Screen.ABOUT:
-            # Scroll up to Back (-1), down to content (0)
-            i = self.state.about_index + delta
-            self.state.about_index = max(-1, min(0, i))
-
-        elif screen == Screen.SCAN:
-            # Scroll up to Back (-1), down to content (0)
-            i = self.state.scan_index + delta
-            self.state.scan_index = max(-1, min(0, i))
+        handler = self._wheel_handlers.get(self.state.screen)
+        if handler:
+            handler(delta)
+
+    # --- Button press, per screen ---
+
+    def _press_menu(self) -> None:
+        # Select menu option
+        option = MENU_OPTIONS[self.state.menu_index]
+        if option == "Browse":
+            self.state.screen = Screen.BROWSE
+        elif option == "Scan":
+            self.state.screen = Screen.SCAN
+        elif option == "About":
+            self.state.screen = Screen.ABOUT
+
+    def _press_browse(self) -> None:
+        if self.state.browse_index == -1:
+            # Back button selected - return to main menu
+            self.state.screen = Screen.MENU
+            self.state.browse_index = 0  # Reset for next time
+        else:
+            # Play selected channel
+            ch = self.state.current_channel
+            if ch:
+                self.tuner.resume()
+                self.tuner.tune_now(ch.url, ch.name)
+                self.display.show_channel_name(ch.name, seconds=3.0)
+                self.state.screen = Screen.TUNE
+
+    def _press_video(self) -> None:
+        # Return to browse (at current channel position)
+        self.tuner.cancel()
+        self.tuner.pause()
+        self.state.screen = Screen.BROWSE
+
+    def _press_about(self) -> None:
+        if self.state.about_index == -1:
+            # Back button selected
+            self.state.screen = Screen.MENU
+            self.state.about_index = 0  # Reset for next time
+
+    def _press_scan(self) -> None:
+        if self.state.scan_index == -1:
+            # Back button selected
+            self.state.screen = Screen.MENU
+            self.state.scan_index = 0  # Reset for next time
+
+    # --- Wheel rotation, per screen ---
+
+    def _wheel_menu(self, delta: int) -> None:
+        # Navigate menu
+        i = self.state.menu_index + delta
+        self.state.menu_index = max(0, min(len(MENU_OPTIONS) - 1, i))
+
+    def _wheel_browse(self, delta: int) -> None:
+        # Navigate channel list (-1 = Back button)
+        if self.state.channels:
+            i = self.state.browse_index + delta
+            self.state.browse_index = max(-1, min(len(self.state.channels) - 1, i))
+        else:
+            # No channels - only Back button is available
+            self.state.browse_index = -1
+
+    def _wheel_video(self, delta: int) -> None:
+        # Change channel (debounced)
+        if self.state.channels:
+            i = self.state.browse_index + delta
+            self.state.browse_index = max(0, min(len(self.state.channels) - 1, i))
+            ch = self.state.current_channel
+            if ch:
+                self.display.show_channel_name(ch.name, seconds=3.0)
+                self.tuner.request_tune(ch.url, ch.name)
+
+    def _wheel_about(self, delta: int) -> None:
+        # Scroll up to Back (-1), down to content (0)
+        i = self.state.about_index + delta
+        self.state.about_index = max(-1, min(0, i))
+
+    def _wheel_scan(self, delta: int) -> None:
+        # Scroll up to Back (-1), down to content (0)
+        i = self.state.scan_index + delta
+        self.state.scan_index = max(-1, min(0, i))
 
     def _get_about_info(self) -> dict[str, str]:
         """Get device info for about screen (placeholder)."""
@@ -250,6 +469,8 @@ class FPTV:
         try:
             print("Releasing GPIOs.")
             self.hw.close()
+            self._stop_loading.set()
+            self._epg_pool.shutdown(wait=False, cancel_futures=True)
             print("Shutting down display (and tuner).")
             self.display.shutdown()
         except Exception as e:
@@ -1,4 +1,6 @@
+import os
 import sys
+from functools import partial
 
 try:
     from systemd import journal
@@ -10,20 +12,56 @@ except ImportError:
     _HAS_JOURNAL = False
 
 
+def _journal_out(tag: str, msg: str) -> None:
+    journal.send(msg, SYSLOG_IDENTIFIER=tag)
+
+
+def _journal_err(tag: str, msg: str) -> None:
+    journal.send(msg, PRIORITY=journal.LOG_ERR, SYSLOG_IDENTIFIER=tag)
+
+
+def _print_out(tag: str, msg: str) -> None:
+    print(f"[{tag}] {msg}")
+
+
+def _print_err(tag: str, msg: str) -> None:
+    print(f"[{tag}] ERROR: {msg}", file=sys.stderr)
+
+
+# Pick the sink once at import rather than branching on every call.
+_out_impl = _journal_out if _HAS_JOURNAL else _print_out
+_err_impl = _journal_err if _HAS_JOURNAL else _print_err
+
+
+def env_flag(name: str) -> bool:
+    """True if environment variable name is set to something truthy (1/true/yes/on)."""
+    return os.environ.get(name, "").lower() in ("1", "true", "yes", "on")
+
+
+# Debug output is off unless FPTV_DEBUG is set to something truthy.
+DEBUG_ENABLED = env_flag("FPTV_DEBUG")
+
+
 class Logger:
-    def __init__(self, tag: str):
+    """
+    Tagged logger: systemd journal on Linux, stdout/stderr elsewhere.
+
+    out(msg) and err(msg) are bound per instance to the sink chosen at import.
+    debug(fmt, *args) is %-formatted only when debug output is enabled; on hot
+    paths, test debug_enabled first so the arguments aren't even built:
+
+        if self.log.debug_enabled:
+            self.log.debug("MPV command: %s rc=%d", args, rc)
+    """
+
+    def __init__(self, tag: str, debug: bool | None = None):
         if tag is None:
             raise ValueError("Missing required argument 'tag'")
         self.tag = tag
+        self.debug_enabled = DEBUG_ENABLED if debug is None else debug
+        self.out = partial(_out_impl, tag)
+        self.err = partial(_err_impl, tag)
 
-    def out(self, msg: str) -> None:
-        if _HAS_JOURNAL:
-            journal.send(f"{msg}", SYSLOG_IDENTIFIER=self.tag)
-        else:
-            print(f"[{self.tag}] {msg}")
-
-    def err(self, msg: str) -> None:
-        if _HAS_JOURNAL:
-            journal.send(f"{msg}", PRIORITY=journal.LOG_ERR, SYSLOG_IDENTIFIER=self.tag)
-        else:
-            print(f"[{self.tag}] ERROR: {msg}", file=sys.stderr)
+    def debug(self, fmt: str, *args: object) -> None:
+        if self.debug_enabled:
+            _out_impl(self.tag, fmt % args if args else fmt)
@@ -1,4 +1,5 @@
 import ctypes
+import math
 import threading
 import time
 from ctypes import (
@@ -6,11 +7,11 @@ from ctypes import (
     POINTER, Structure, CFUNCTYPE, byref
 )
 from ctypes.util import find_library
+from functools import lru_cache
+from typing import Callable
 
-from fptv.gl import mpv_opengl_get_proc_address_fn
-from fptv.log import Logger
-
-MPV_SOCK = "/tmp/fptv-mpv.sock"
+from fptv.gl import GL, mpv_opengl_get_proc_address_fn
+from fptv.log import Logger, env_flag
 
 # mpv_format enum values (from mpv/client.h)
 MPV_FORMAT_NONE = 0
@@ -24,6 +25,9 @@ MPV_FORMAT_NODE_ARRAY = 7
 MPV_FORMAT_NODE_MAP = 8
 MPV_FORMAT_BYTE_ARRAY = 9
 
+# mpv_event_id values (from mpv/client.h)
+MPV_EVENT_NONE = 0
+
 MPV_USERAGENT = "fptv/embedded-mpv"
 
 # mpv_render_param_type values (from render.h)
@@ -47,6 +51,57 @@ MPV_OPT_NETWORK_TIMEOUT_S = 30
 
 MPV_FLAG_PAUSE = "pause"
 
+# Options applied by EmbeddedMPV.initialize() before mpv_initialize(), encoded once at import.
+_MPV_INIT_OPTS: tuple[tuple[bytes, bytes], ...] = tuple((n.encode("utf-8"), v.encode("utf-8")) for n, v in (
+    # Tag all our requests.
+    ("user-agent", MPV_USERAGENT),
+    ("network-timeout", str(MPV_OPT_NETWORK_TIMEOUT_S)),
+
+    # Critical: prevent mpv from opening vo=gpu/drm/sdl, which fights SDL/KMS.
+    ("vo", "libmpv"),
+
+    # Make mpv quiet & kiosk-friendly.
+    ("terminal", "no"),
+    ("load-scripts", "no"),  # Otherwise it loads a bunch of lua scripts
+    ("config", "no"),  # Ignore ~/.config/mpv/mpv.conf
+    ("input-default-bindings", "no"),
+    ("osc", "no"),
+
+    # Remove OSD clutter.
+    ("osd-level", "0"),
+
+    # Configure log level and logfile.
+    ("log-file", "/tmp/mpv.log"),
+    ("msg-level", "all=warn"),
+    # ("msg-level", "all=no"),
+
+    # Optional. Might help present frames more predictably.
+    ("video-sync", "display-resample"),
+    ("interpolation", "no"),  # Can toggle if necessary. Keeping it simple ('no') for now.
+
+    # Helpful defaults for your kiosk use-case.
+    ("keep-open", "no"),
+    ("idle", "yes"),
+
+    # Pi/KMS friendliness
+    ("gpu-api", MPV_OPT_RENDER_API_TYPE_OPENGL),
+    ("opengl-es", "yes"),
+    ("hwdec", "no"),
+    ("vd-lavc-dr", "no"),
+
+    # YouTube: depends on build/config; harmless if unused.
+    ("ytdl", "no"),
+))
+
+# Fixed property names and command arguments, encoded once; only URLs and numbers
+# are encoded per call.
+_B_PAUSE = MPV_FLAG_PAUSE.encode("utf-8")
+_B_STOP = b"stop"
+_B_LOADFILE = b"loadfile"
+_B_REPLACE = b"replace"
+_B_ADD = b"add"
+_B_VOLUME = b"volume"
+
 class MPVError(RuntimeError):
     pass
 
@@ -89,10 +144,30 @@ class mpv_opengl_fbo(Structure):
 mpv_render_update_fn = CFUNCTYPE(None, c_void_p)
 
 
+@lru_cache(maxsize=64)
+def _encode_url(url: str) -> bytes:
+    """UTF-8 bytes for a stream URL; channel surfing revisits the same few URLs."""
+    return url.encode("utf-8")
+
+
+def _make_argv(*args: bytes) -> ctypes.Array:
+    """Build the NULL-terminated const char ** that mpv_command() takes."""
+    return (c_char_p * (len(args) + 1))(*args)  # trailing slot defaults to NULL
+
+
 def _load_cdll(names: list[str]) -> ctypes.CDLL:
+    """
+    Load the first library in names that opens.
+
+    Explicit sonames (e.g. libmpv.so.2) are dlopen'd directly first; bare names
+    go through find_library() only if none of those worked, since on Linux it
+    shells out to ldconfig/gcc.
+    """
     last_err = None
-    for n in names:
-        path = find_library(n) or n
+    for n in sorted(names, key=lambda n: ".so" not in n):  # stable: sonames first
+        path = n if ".so" in n else find_library(n)
+        if not path:
+            continue
         try:
             return ctypes.CDLL(path)
         except OSError as e:
@@ -101,13 +176,23 @@ def _load_cdll(names: list[str]) -> ctypes.CDLL:
 
 
 def _try_load_cdll(names: list[str]) -> ctypes.CDLL | None:
-    for n in names:
-        path = find_library(n) or n
-        try:
-            return ctypes.CDLL(path)
-        except OSError:
-            pass
-    return None
+    try:
+        return _load_cdll(names)
+    except OSError:
+        return None
+
+
+def _bind_get_proc_address(lib: ctypes.CDLL | None, name: str):
+    """Return lib's void *name(const char *) function with its prototype set, or None."""
+    if lib is None:
+        return None
+    try:
+        fn = getattr(lib, name)
+    except AttributeError:
+        return None
+    fn.argtypes = [c_char_p]
+    fn.restype = c_void_p
+    return fn
 
 
 class EmbeddedMPV:
@@ -122,25 +207,43 @@ class EmbeddedMPV:
       - main loop: mpv.maybe_render(width, height); pygame.display.flip()
     """
 
+    # One instance, but its attributes are read on every frame; slots make those
+    # loads fixed-offset rather than dict lookups. Add new attributes here.
+    __slots__ = (
+        "log", "_mpv", "_egl", "_sdl", "_sdl_get_proc", "_egl_get_proc", "_proc_cache", "_gl",
+        "_handle", "_render_ctx", "_fbo", "_flip_y", "_render_params",
+        "_ctx_update", "_ctx_render", "_ctx_report_swap", "_gl_viewport",
+        "_update_event", "_cb_get_proc", "_cb_update",
+        "_pending_url", "_current_url", "_switch_after", "_switch_inflight_until",
+        "_stage", "_stop_until", "_next_url", "_next_action_at", "_next_action",
+        "_debounce_s", "_min_switch_gap_s", "_stop_settle_s",
+        "_argv_stop", "_argv_loadfile", "_flag", "_flag_ref", "_argv_pool",
+    )
+
     def __init__(self) -> None:
-        self.log = Logger("mpv")
+        # FPTV_MPV_DEBUG turns on debug output for mpv alone; otherwise follow FPTV_DEBUG.
+        self.log = Logger("mpv", debug=True if env_flag("FPTV_MPV_DEBUG") else None)
         self._mpv = _load_cdll(["mpv", "libmpv.so.2", "libmpv.so.1", "libmpv.so"])
         self._egl = _try_load_cdll(["EGL", "libEGL.so.1", "libEGL.so"])
         self._sdl = _try_load_cdll(["SDL2", "libSDL2-2.0.so.0", "libSDL2.so"])
 
-        # OpenGL/GLES (for glViewport; mpv does not set viewport for you)
-        self._gl = _try_load_cdll(["GLESv2", "libGLESv2.so.2", "libGLESv2.so"]) or \
-                   _try_load_cdll(["GL", "libGL.so.1", "libGL.so"])
-        if self._gl:
-            try:
-                self._gl.glViewport.argtypes = [c_int, c_int, c_int, c_int]
-                self._gl.glViewport.restype = None
-            except Exception as e:
-                raise RuntimeError(f"Failed to initialize GL viewport: {e}")
+        # GL loaders for _get_proc_address(); prototypes declared once here, not per lookup.
+        self._sdl_get_proc = _bind_get_proc_address(self._sdl, "SDL_GL_GetProcAddress")
+        self._egl_get_proc = _bind_get_proc_address(self._egl, "eglGetProcAddress")
+        self._proc_cache: dict[bytes, int] = {}  # GL symbol name -> address (0 = not found)
+
+        # OpenGL/GLES (for glViewport; mpv does not set viewport for you). Shared
+        # with the rest of the app: same library, prototypes already declared.
+        self._gl = GL
 
         self._handle = c_void_p(None)
         self._render_ctx = c_void_p(None)
 
+        # Per-frame render arguments, built in initialize() and reused by maybe_render()
+        self._fbo: mpv_opengl_fbo | None = None
+        self._flip_y: c_int | None = None
+        self._render_params: ctypes.Array | None = None
+
         # Thread-safe “poke” from mpv update callback to your loop.
         self._update_event = threading.Event()
 
@@ -157,14 +260,29 @@ class EmbeddedMPV:
         self._stop_until = 0.0
         self._next_url: str | None = None
 
+        # tick() runs _next_action(now) once now reaches _next_action_at; see _schedule()
+        self._next_action_at = math.inf
+        self._next_action: Callable[[float], bool] | None = None
+
         # tune these
         self._debounce_s = MPV_DEBOUNCE_PLAY_S
         self._min_switch_gap_s = MPV_MIN_SWITCH_GAP_S
         self._stop_settle_s = MPV_DEBOUNCE_PLAY_S
 
+        # Commands with no dynamic arguments, built once rather than per call
+        self._argv_stop = _make_argv(_B_STOP)
+        # loadfile <url> replace: only the URL slot changes between tunes
+        self._argv_loadfile = _make_argv(_B_LOADFILE, b"", _B_REPLACE)
+        # Scratch MPV_FORMAT_FLAG value for _set_property_flag (main loop thread only)
+        self._flag = c_int(0)
+        self._flag_ref = byref(self._flag)
+
+        # Reusable argv arrays for _exec(), keyed by slot count (args + NULL)
+        self._argv_pool: dict[int, ctypes.Array] = {}
+
         self._bind_functions()
 
-        print("MVP init complete")
+        self.log.debug("MPV init complete")
 
     def _bind_functions(self) -> None:
         # --- core ---
@@ -183,10 +301,6 @@ class EmbeddedMPV:
         self._mpv.mpv_get_property.argtypes = [c_void_p, c_char_p, c_int, c_void_p]
         self._mpv.mpv_get_property.restype = c_int
 
-        # char *mpv_get_property_string(mpv_handle *ctx, const char *name);
-        self._mpv.mpv_get_property_string.argtypes = [c_void_p, c_char_p]
-        self._mpv.mpv_get_property_string.restype = c_void_p  # returns char* you must mpv_free()
-
         self._mpv.mpv_set_property.argtypes = [c_void_p, c_char_p, c_int, c_void_p]
         self._mpv.mpv_set_property.restype = c_int
 
@@ -223,6 +337,12 @@ class EmbeddedMPV:
         self._mpv.mpv_render_context_report_swap.argtypes = [c_void_p]
         self._mpv.mpv_render_context_report_swap.restype = None
 
+        # Per-frame calls, resolved once so the hot path skips the CDLL attribute lookup.
+        self._ctx_update = self._mpv.mpv_render_context_update
+        self._ctx_render = self._mpv.mpv_render_context_render
+        self._ctx_report_swap = self._mpv.mpv_render_context_report_swap
+        self._gl_viewport = self._gl.glViewport if self._gl else None
+
     # -------------
     # Public API
     # -------------
@@ -236,44 +356,10 @@ class EmbeddedMPV:
         if not self._handle:
             raise RuntimeError("mpv_create() failed")
 
-        # Tag all our requests.
-        self._set_opt("user-agent", MPV_USERAGENT)
-        self._set_opt("network-timeout", str(str(MPV_OPT_NETWORK_TIMEOUT_S)))
-
-        # Critical: prevent mpv from opening vo=gpu/drm/sdl, which fights SDL/KMS.
-        self._set_opt("vo", "libmpv")
-
-        # Make mpv quiet & kiosk-friendly.
-        self._set_opt("terminal", "no")
-        self._set_opt("load-scripts", "no")  # Otherwise it loads a bunch of lua scripts
-        self._set_opt("config", "no")  # Ignore ~/.config/mpv/mpv.conf
-        self._set_opt("input-default-bindings", "no")
-        self._set_opt("osc", "no")
-
-        # Remove OSD clutter.
-        self._set_opt("osd-level", "0")
-
-        # Configure log level and logfile.
-        self._set_opt("log-file", "/tmp/mpv.log")
-        self._set_opt("msg-level", "all=warn")
-        # self._set_opt("msg-level", "all=no")
-
-        # Optional. Might help present frames more predictably.
-        self._set_opt("video-sync", "display-resample")
-        self._set_opt("interpolation", "no")  # Can toggle if necessary. Keeping it simple ('no') for now.
-
-        # Helpful defaults for your kiosk use-case.
-        self._set_opt("keep-open", "no")
-        self._set_opt("idle", "yes")
-
-        # Pi/KMS friendliness
-        self._set_opt("gpu-api", MPV_OPT_RENDER_API_TYPE_OPENGL)
-        self._set_opt("opengl-es", "yes")
-        self._set_opt("hwdec", "no")
-        self._set_opt("vd-lavc-dr", "no")
-
-        # YouTube: depends on build/config; harmless if unused.
-        self._set_opt("ytdl", "no")
+        set_opt = self._mpv.mpv_set_option_string
+        for name, value in _MPV_INIT_OPTS:
+            # ignore rc for “best-effort” options; you can assert if you prefer
+            set_opt(self._handle, name, value)
 
         rc = self._mpv.mpv_initialize(self._handle)
         if rc < 0:
@@ -292,8 +378,8 @@ class EmbeddedMPV:
 
         params = (mpv_render_param * 3)(
             mpv_render_param(MPV_RENDER_PARAM_API_TYPE, ctypes.cast(api_type, c_void_p)),
-            mpv_render_param(MPV_RENDER_PARAM_OPENGL_INIT_PARAMS, ctypes.cast(byref(init_params), c_void_p)),
-            #            mpv_render_param(MPV_RENDER_PARAM_ADVANCED_CONTROL, ctypes.cast(byref(advanced), c_void_p)),
+            mpv_render_param(MPV_RENDER_PARAM_OPENGL_INIT_PARAMS, ctypes.addressof(init_params)),
+            #            mpv_render_param(MPV_RENDER_PARAM_ADVANCED_CONTROL, ctypes.addressof(advanced)),
             mpv_render_param(MPV_RENDER_PARAM_INVALID, None),
         )
 
@@ -304,88 +390,110 @@ class EmbeddedMPV:
 
         self._render_ctx = out_ctx
 
+        # Allocate the render call's arguments once; maybe_render() only updates the size.
+        # The params array points into _fbo/_flip_y, so those must outlive it.
+        self._fbo = mpv_opengl_fbo(fbo=0, w=0, h=0, internal_format=0)
+        self._flip_y = c_int(1)
+        self._render_params = (mpv_render_param * 3)(
+            mpv_render_param(MPV_RENDER_PARAM_OPENGL_FBO, ctypes.addressof(self._fbo)),
+            mpv_render_param(MPV_RENDER_PARAM_FLIP_Y, ctypes.addressof(self._flip_y)),
+            mpv_render_param(MPV_RENDER_PARAM_INVALID, None),
+        )
         # Register update callback ASAP. mpv will invoke it immediately once set.
         self._mpv.mpv_render_context_set_update_callback(self._render_ctx, self._cb_update, None)
 
     def pause(self) -> int:
-        return self._set_property_flag(MPV_FLAG_PAUSE.encode("utf-8"), True)
+        return self._set_property_flag(_B_PAUSE, True)
 
     def resume(self) -> int:
-        return self._set_property_flag(MPV_FLAG_PAUSE.encode("utf-8"), False)
-
-    def is_paused(self) -> bool:
-        return self._get_property_flag(MPV_FLAG_PAUSE.encode("utf-8"))
+        return self._set_property_flag(_B_PAUSE, False)
 
     def stop(self):
-        self._exec("stop")
+        self._command(self._argv_stop)
 
     def get_volume(self) -> int:
         """Get current volume level (0-100)."""
         v = ctypes.c_double()
-        err = self._mpv.mpv_get_property(self._handle, b"volume", MPV_FORMAT_DOUBLE, byref(v))
+        err = self._mpv.mpv_get_property(self._handle, _B_VOLUME, MPV_FORMAT_DOUBLE, byref(v))
         if err < 0:
             self.log.err(f"mpv_get_property('volume') failed: {err}")
             return 0
         return int(v.value)
 
     def report_swap(self) -> None:
-        self._mpv.mpv_render_context_report_swap(self._render_ctx)
+        self._ctx_report_swap(self._render_ctx)
 
-    def tick(self) -> bool:
+    def tick(self, now: float | None = None) -> bool:
         """
         Call every frame.
         Returns True if we *initiated* a tune (either stop or loadfile).
 
         This is intentionally non-blocking (no sleep), so the render loop can keep
         calling mpv_render_context_render() regularly.
-        """
-        now = time.time()
-
-        # Stage 2: we already issued stop; wait a short settle window, then load.
-        if self._stage == "stop_wait":
-            if now < self._stop_until:
-                return False
-            url = self._next_url
-            self._next_url = None
-            self._stage = None
-
-            if not url or url == self._current_url:
-                return False
-
-            self._exec("loadfile", url, "replace")
-            self._set_property_flag(MPV_FLAG_PAUSE.encode("utf-8"), False)
-            self._current_url = url
-            # prevent immediate re-tune storms
-            self._switch_inflight_until = now + self._min_switch_gap_s
-            return True
-
-        # Nothing queued.
-        if not self._pending_url:
-            return False
 
-        # Debounce/coalesce rapid selection changes.
-        if now < self._switch_after:
-            return False
+        Args:
+            now: Frame timestamp from time.monotonic(); read here if omitted.
+        """
+        if now is None:
+            now = time.monotonic()
 
-        # Enforce a minimum gap between tune attempts.
-        if now < self._switch_inflight_until:
+        # Nothing due: the common case is this one compare.
+        if now < self._next_action_at:
             return False
+        return self._next_action(now)
 
+    def _schedule(self) -> None:
+        """Point tick() at the next tune step and the time it becomes due."""
+        if self._stage == "stop_wait":
+            self._next_action_at = self._stop_until
+            self._next_action = self._finish_switch
+        elif self._pending_url:
+            # Debounce/coalesce rapid selection changes, and enforce a minimum gap
+            # between tune attempts.
+            self._next_action_at = max(self._switch_after, self._switch_inflight_until)
+            self._next_action = self._begin_switch
+        else:
+            self._next_action_at = math.inf
+            self._next_action = None
+
+    def _begin_switch(self, now: float) -> bool:
+        """Stage 1: stop, then let the HTTP connection close a moment."""
         url = self._pending_url
         self._pending_url = None
 
         # no-op if it's already playing this url
         if url == self._current_url:
+            self._schedule()
             return False
 
-        # Stage 1: stop, then let the HTTP connection close a moment.
-        self._exec("stop")
+        self._command(self._argv_stop)
         self._stage = "stop_wait"
         self._next_url = url
         self._stop_until = now + self._stop_settle_s
 
         # Reserve the "inflight" window starting now (includes settle time).
         self._switch_inflight_until = now + self._min_switch_gap_s
+        self._schedule()
+        return True
+
+    def _finish_switch(self, now: float) -> bool:
+        """Stage 2: we already issued stop and waited a short settle window; now load."""
+        url = self._next_url
+        self._next_url = None
+        self._stage = None
+
+        if not url or url == self._current_url:
+            self._schedule()
+            return False
+
+        argv = self._argv_loadfile
+        argv[1] = _encode_url(url)
+        self._command(argv)
+        self._set_property_flag(_B_PAUSE, False)
+        self._current_url = url
+        # prevent immediate re-tune storms
+        self._switch_inflight_until = now + self._min_switch_gap_s
+        self._schedule()
         return True
 
     def shutdown(self) -> None:
@@ -402,25 +510,27 @@ class EmbeddedMPV:
             self._mpv.mpv_terminate_destroy(self._handle)
             self._handle = c_void_p(None)
 
-        print("MPV shutdown complete.")
+        self.log.out("MPV shutdown complete.")
 
     def loadfile(self, url: str) -> None:
         """Coalesce rapid requests; latest wins."""
         self.initialize()
         self._pending_url = url
-        self._switch_after = time.time() + self._debounce_s
+        self._switch_after = time.monotonic() + self._debounce_s
+        self._schedule()
 
     def loadfile_now(self, url: str) -> None:
         """Queue a tune immediately (no debounce). Useful for watchdog recovery."""
         self.initialize()
         self._pending_url = url
         self._switch_after = 0.0
+        self._schedule()
 
     def add_volume(self, delta: int) -> None:
         """
         Adjust volume and show an overlay.
         """
-        self._exec("add", "volume", str(delta))
+        self._exec(_B_ADD, _B_VOLUME, str(delta).encode("ascii"))
 
     def maybe_render(self, w: int, h: int, force: bool = False) -> bool:
         """
@@ -429,25 +539,30 @@ class EmbeddedMPV:
         if not self._render_ctx:
             return False
 
-        flags = int(self._mpv.mpv_render_context_update(self._render_ctx))
+        # mpv fires the update callback whenever mpv_render_context_update() has
+        # something to report, so with no callback since the last check there is
+        # nothing to ask it. Clear before asking so a callback racing with the
+        # update call is seen next frame rather than lost.
+        if not self._update_event.is_set():
+            if not force:
+                return False
+        else:
+            self._update_event.clear()
+
+        flags = self._ctx_update(self._render_ctx)
         want = (flags & MPV_RENDER_UPDATE_FRAME) != 0
 
         if not want and not force:
             return False
 
-        if self._gl:
-            self._gl.glViewport(0, 0, w, h)
-
-        fbo = mpv_opengl_fbo(fbo=0, w=w, h=h, internal_format=0)
-        flip_y = c_int(1)
+        if self._gl_viewport is not None:
+            self._gl_viewport(0, 0, w, h)
 
-        render_params = (mpv_render_param * 3)(
-            mpv_render_param(MPV_RENDER_PARAM_OPENGL_FBO, ctypes.cast(byref(fbo), c_void_p)),
-            mpv_render_param(MPV_RENDER_PARAM_FLIP_Y, ctypes.cast(byref(flip_y), c_void_p)),
-            mpv_render_param(MPV_RENDER_PARAM_INVALID, None),
-        )
+        fbo = self._fbo
+        fbo.w = w
+        fbo.h = h
 
-        rc = self._mpv.mpv_render_context_render(self._render_ctx, render_params)
+        rc = self._ctx_render(self._render_ctx, self._render_params)
         return rc >= 0
 
     def poll_events(self) -> None:
@@ -459,69 +574,86 @@ class EmbeddedMPV:
             if not evp:
                 break
             ev = evp.contents
-            if ev.event_id == 0:  # MPV_EVENT_NONE
+            if ev.event_id == MPV_EVENT_NONE:
                 break
 
-    def _set_opt(self, name: str, value: str) -> int:
-        rc = self._mpv.mpv_set_option_string(self._handle, name.encode("utf-8"), value.encode("utf-8"))
-        # ignore rc for “best-effort” options; you can assert if you prefer
+    def _set_property_flag(self, name: bytes, value: bool) -> int:
+        self._flag.value = 1 if value else 0
+        rc = self._mpv.mpv_set_property(self._handle, name, MPV_FORMAT_FLAG, self._flag_ref)
+        if self.log.debug_enabled:
+            self.log.debug("MPV set_property_flag: %r=%s rc=%d", name, value, rc)
+        elif rc < 0:
+            self.log.err(f"mpv_set_property({name!r}) failed: {rc}")
         return rc
 
-    def _get_property_flag(self, name: bytes) -> bool:
-        v = c_int()  # FLAG uses int (0/1)
-        err = self._mpv.mpv_get_property(self._handle, name, MPV_FORMAT_FLAG, byref(v))
-        if err < 0 or err > 1:
-            self.log.err(f"mpv_get_property('pause') failed: {err}")
-        return bool(v.value)
+    def _exec(self, *args: str | bytes) -> int:
+        """
+        Run an mpv command. bytes arguments are passed through without encoding.
 
-    def _set_property_flag(self, name: bytes, value: bool) -> int:
-        v = ctypes.c_int(1 if value else 0)
-        rc = self._mpv.mpv_set_property(self._handle, name, MPV_FORMAT_FLAG, byref(v))
-        print(f"MPV set_property_flag: {name}={value} rc={rc}")
-        return rc
+        The argv array is reused between calls of the same arity. That's safe
+        because mpv_command() copies its arguments before returning, and all
+        commands are issued from the main loop thread.
+        """
+        n = len(args)
+        argv = self._argv_pool.get(n + 1)
+        if argv is None:
+            argv = self._argv_pool[n + 1] = (c_char_p * (n + 1))()  # trailing slot stays NULL
+        for i, a in enumerate(args):
+            argv[i] = a if isinstance(a, bytes) else a.encode("utf-8")
+        return self._command(argv)
 
-    def _exec(self, *args: str) -> int:
+    def _command(self, argv: ctypes.Array) -> int:
+        """Run an mpv command from a prebuilt argv (see _make_argv)."""
         if not self._handle:
             raise RuntimeError("MPV not initialized")
 
-        argv = (c_char_p * (len(args) + 1))()
-        for i, a in enumerate(args):
-            argv[i] = a.encode("utf-8")
-        argv[len(args)] = None
-
         rc = self._mpv.mpv_command(self._handle, argv)
-        print(f"MPV command: {args}. Error code: {rc}")
+        if self.log.debug_enabled:
+            self.log.debug("MPV command: %s rc=%d", argv[:-1], rc)
+        elif rc < 0:
+            self.log.err(f"mpv_command({argv[0]!r}) failed: {rc}")
         return rc
 
     def _on_mpv_update(self, _ctx: c_void_p) -> None:
-        # Don't call any mpv API here.
-        self._update_event.set()
+        # Don't call any mpv API here. mpv may call this several times per frame;
+        # only the first since the main loop last cleared the event needs set()'s
+        # lock and notify, the rest are a flag read.
+        if not self._update_event.is_set():
+            self._update_event.set()
 
-    def _get_proc_address(self, _ctx: c_void_p, name: bytes) -> c_void_p:
+    def _get_proc_address(self, _ctx: c_void_p, name: bytes) -> int | None:
         """
         mpv calls this to resolve OpenGL function pointers.
 
+        Results (including misses) are remembered, so re-creating the render
+        context doesn't resolve the same few hundred symbols again.
+        """
+        if not name:
+            return None
+        p = self._proc_cache.get(name)
+        if p is None:
+            p = self._proc_cache[name] = self._lookup_proc_address(name)
+        return p or None
+
+    def _lookup_proc_address(self, name: bytes) -> int:
+        """
         We try SDL_GL_GetProcAddress first (since pygame uses SDL2),
-        then fall back to eglGetProcAddress if available.
+        then fall back to eglGetProcAddress if available. Returns 0 if neither has it.
         """
-        if self._sdl is not None:
+        if self._sdl_get_proc is not None:
             try:
-                self._sdl.SDL_GL_GetProcAddress.argtypes = [c_char_p]
-                self._sdl.SDL_GL_GetProcAddress.restype = c_void_p
-                p = self._sdl.SDL_GL_GetProcAddress(name)
+                p = self._sdl_get_proc(name)
                 if p:
                     return p
             except Exception:
                 pass
 
-        if self._egl is not None:
+        if self._egl_get_proc is not None:
             try:
-                self._egl.eglGetProcAddress.argtypes = [c_char_p]
-                self._egl.eglGetProcAddress.restype = c_void_p
-                p = self._egl.eglGetProcAddress(name)
+                p = self._egl_get_proc(name)
                 if p:
                     return p
             except Exception:
                 pass
 
-        return c_void_p(None)
+        return 0
@@ -0,0 +1,62 @@
+"""
+Frame pacing: fixed-rate, drift-corrected frame deadlines.
+"""
+import time
+from typing import Callable
+
+# Resync instead of bursting frames if we fall this many periods behind.
+MAX_LAG_FRAMES = 2
+
+# OS timeouts overshoot by up to a scheduler tick; block until this close to the
+# deadline, then spin for the remainder.
+SPIN_S = 0.0005
+
+
+class FramePacer:
+    """
+    Replacement for pygame.time.Clock.tick().
+
+    Rather than sleeping blindly until the next frame, the caller supplies a
+    blocking wait (e.g. InputMapper.wait) so input arriving mid-frame wakes the
+    loop immediately instead of at the next tick boundary.
+
+    Usage:
+        pacer = FramePacer(60)
+
+        while running:
+            pacer.wait(input_mapper.wait)
+            ...
+    """
+
+    def __init__(self, fps: float):
+        self.period = 1.0 / fps
+        self._deadline = time.perf_counter() + self.period
+
+    def wait(self, block: Callable[[float], bool]) -> bool:
+        """
+        Wait for the current frame deadline.
+
+        Args:
+            block: Called with the remaining time in seconds; should block for at
+                   most that long and return True if woken early, False on
+                   timeout.
+
+        Returns:
+            True if a new frame period started, False if woken early by block().
+        """
+        # block() may also return False before its timeout (OS timers undershoot);
+        # go back to blocking rather than spinning out the rest of the frame.
+        remaining = self._deadline - time.perf_counter()
+        while remaining > SPIN_S:
+            if block(remaining - SPIN_S):
+                return False
+            remaining = self._deadline - time.perf_counter()
+        while time.perf_counter() < self._deadline:
+            pass
+
+        # Advance from the previous deadline (not from "now") so error doesn't accumulate.
+        self._deadline += self.period
+        now = time.perf_counter()
+        if now - self._deadline > MAX_LAG_FRAMES * self.period:
+            self._deadline = now + self.period
+        return True
@@ -1,5 +1,8 @@
 import ctypes
+import math
+import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional, Callable, Dict, Tuple
 
@@ -49,6 +52,76 @@ FG_ALERT = (255, 40, 40)
 FG_ACCENT_BLUE = (90, 105, 255)
 FG_ACCENT_YELLOW = (220, 150, 0)
 
+# Rendered text for the small, fixed vocabulary of the menu screens (menu items,
+# headers, channel names). Keyed by (font, text, color); surfaces are only ever
+# blitted, never modified, so sharing them is safe. Least recently used entries are
+# evicted first, so a long channel list can't flush the menu's own strings.
+TEXT_CACHE_MAX = 256
+_text_cache: "OrderedDict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface]" = OrderedDict()
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Antialiased font.render(), cached across calls."""
+    key = (font, text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        if len(_text_cache) >= TEXT_CACHE_MAX:
+            _text_cache.popitem(last=False)
+        surf = _text_cache[key] = font.render(text, True, color)
+    else:
+        _text_cache.move_to_end(key)
+    return surf
+
+
+_fit_cache: Dict[Tuple[pygame.font.Font, str, int], str] = {}
+
+
+def fit_text(font: pygame.font.Font, text: str, max_width: int) -> str:
+    """
+    Return text, or text truncated with "..." so it renders within max_width pixels.
+
+    Measures with font.size() rather than rendering each candidate, and remembers
+    the result: the same EPG titles are refitted on every Browse redraw.
+    """
+    key = (font, text, max_width)
+    fitted = _fit_cache.get(key)
+    if fitted is None:
+        fitted = text
+        if font.size(text)[0] > max_width:
+            while fitted and font.size(fitted + "...")[0] > max_width:
+                fitted = fitted[:-1]
+            fitted = fitted + "..." if fitted else ""
+        if len(_fit_cache) >= TEXT_CACHE_MAX:
+            _fit_cache.clear()  # Titles roll over with the EPG; no need for LRU order
+        _fit_cache[key] = fitted
+    return fitted
+
+
+# Channel masks that lay a 32-bit pixel out in memory as R, G, B, A bytes: what
+# GL_RGBA/GL_UNSIGNED_BYTE reads, so such surfaces upload straight from their pixels.
+RGBA_MASKS = ((0x000000FF, 0x0000FF00, 0x00FF0000, 0xFF000000) if sys.byteorder == "little"
+              else (0xFF000000, 0x00FF0000, 0x0000FF00, 0x000000FF))
+
+
+def make_rgba_surface(w: int, h: int) -> pygame.Surface:
+    """A per-pixel-alpha surface in GL_RGBA byte order (see surface_pixels())."""
+    return pygame.Surface((w, h), pygame.SRCALPHA, 32, RGBA_MASKS)
+
+
+def surface_pixels(surf: pygame.Surface) -> ctypes.Array:
+    """
+    The surface's pixels as GL_RGBA bytes, rows top to bottom, for glTex(Sub)Image2D.
+
+    Surfaces from make_rgba_surface() are exposed in place, no copy: the array
+    wraps the surface's own buffer (keeping it locked while the array lives).
+    Anything else falls back to a converted copy via pygame.image.tostring().
+    Rows are not flipped; the quads map v=0 to the top edge instead.
+    """
+    if surf.get_masks() == RGBA_MASKS and surf.get_pitch() == surf.get_width() * 4:
+        view = surf.get_view("1")
+        return (ctypes.c_char * view.length).from_buffer(view)
+    return ctypes.create_string_buffer(pygame.image.tostring(surf, "RGBA", False))
+
 
 class GLOverlayQuad:
     """
@@ -56,10 +129,44 @@ class GLOverlayQuad:
     Designed for small overlays (text, volume HUD), not full-screen UI.
     """
 
+    # All overlay quads draw with the same shader; compile/link it once and share it.
+    _program: Optional[Tuple[int, int, int, int]] = None  # (prog, loc_pos, loc_uv, loc_tex)
+
     def __init__(self, screen_w: int, screen_h: int):
         self.screen_w = screen_w
         self.screen_h = screen_h
 
+        self.prog, self.loc_pos, self.loc_uv, self.loc_tex = self._get_program()
+
+        # VBO (we'll rewrite it each draw)
+        vbo = ctypes.c_uint(0)
+        GL.glGenBuffers(1, ctypes.byref(vbo))
+        self.vbo = vbo.value
+
+        # Texture (allocated on first update)
+        tex = ctypes.c_uint(0)
+        GL.glGenTextures(1, ctypes.byref(tex))
+        self.tex = tex.value
+
+        GL.glActiveTexture(GL_TEXTURE0)
+        GL.glBindTexture(GL_TEXTURE_2D, self.tex)
+        GL.glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        GL.glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        GL.glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        GL.glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+
+        self.tex_w = 0
+        self.tex_h = 0
+
+        # Ensure blending is on for alpha overlays
+        GL.glEnable(GL_BLEND)
+        GL.glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+    @classmethod
+    def _get_program(cls) -> Tuple[int, int, int, int]:
+        if cls._program is not None:
+            return cls._program
+
         vs_src = """#version 300 es
         precision mediump float;
         layout(location=0) in vec2 a_pos;
@@ -83,37 +190,16 @@ class GLOverlayQuad:
 
         vs = compile_shader(vs_src, GL_VERTEX_SHADER)
         fs = compile_shader(fs_src, GL_FRAGMENT_SHADER)
-        self.prog = link_program(vs, fs)
+        prog = link_program(vs, fs)
 
-        GL.glUseProgram(self.prog)
-        self.loc_pos = GL.glGetAttribLocation(self.prog, b"a_pos")
-        self.loc_uv = GL.glGetAttribLocation(self.prog, b"a_uv")
-        self.loc_tex = GL.glGetUniformLocation(self.prog, b"u_tex")
-        GL.glUniform1i(self.loc_tex, 0)
+        GL.glUseProgram(prog)
+        loc_pos = GL.glGetAttribLocation(prog, b"a_pos")
+        loc_uv = GL.glGetAttribLocation(prog, b"a_uv")
+        loc_tex = GL.glGetUniformLocation(prog, b"u_tex")
+        GL.glUniform1i(loc_tex, 0)
 
-        # VBO (we'll rewrite it each draw)
-        vbo = ctypes.c_uint(0)
-        GL.glGenBuffers(1, ctypes.byref(vbo))
-        self.vbo = vbo.value
-
-        # Texture (allocated on first update)
-        tex = ctypes.c_uint(0)
-        GL.glGenTextures(1, ctypes.byref(tex))
-        self.tex = tex.value
-
-        GL.glActiveTexture(GL_TEXTURE0)
-        GL.glBindTexture(GL_TEXTURE_2D, self.tex)
-        GL.glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        GL.glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        GL.glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        GL.glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-
-        self.tex_w = 0
-        self.tex_h = 0
-
-        # Ensure blending is on for alpha overlays
-        GL.glEnable(GL_BLEND)
-        GL.glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        cls._program = (prog, loc_pos, loc_uv, loc_tex)
+        return cls._program
 
     def update_from_surface(self, surf: pygame.Surface) -> None:
         """
@@ -121,8 +207,7 @@ class GLOverlayQuad:
         For overlays, keep surf small to avoid bandwidth.
         """
         w, h = surf.get_width(), surf.get_height()
-        rgba = pygame.image.tostring(surf, "RGBA", True)  # flip_y=True
-        buf = ctypes.create_string_buffer(rgba)
+        buf = surface_pixels(surf)
 
         GL.glActiveTexture(GL_TEXTURE0)
         GL.glBindTexture(GL_TEXTURE_2D, self.tex)
@@ -136,10 +221,11 @@ class GLOverlayQuad:
             GL.glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, w, h, GL_RGBA, GL_UNSIGNED_BYTE,
                                ctypes.cast(buf, ctypes.c_void_p))
 
-    def draw(self, x: int, y: int, w: int | None = None, h: int | None = None) -> None:
+    def draw(self, x: int, y: int, w: int | None = None, h: int | None = None, *, set_state: bool = True) -> None:
         """
         Draw the overlay at (x,y) in pixels (top-left origin), scaled to (w,h) if provided.
         If w/h omitted, uses texture dimensions.
+        Pass set_state=False when the caller already called set_overlay_gl_state().
         """
         if self.tex_w == 0 or self.tex_h == 0:
             return
@@ -153,20 +239,16 @@ class GLOverlayQuad:
         y0 = 1.0 - (y / self.screen_h) * 2.0
         y1 = 1.0 - ((y + h) / self.screen_h) * 2.0
 
-        # Triangle strip: (pos.xy, uv.xy)
+        # Triangle strip: (pos.xy, uv.xy). Texture rows are top-down, so v=0 is the top.
         verts = (ctypes.c_float * 16)(
-            x0, y1, 0.0, 0.0,  # bottom-left
-            x1, y1, 1.0, 0.0,  # bottom-right
-            x0, y0, 0.0, 1.0,  # top-left
-            x1, y0, 1.0, 1.0,  # top-right
+            x0, y1, 0.0, 1.0,  # bottom-left
+            x1, y1, 1.0, 1.0,  # bottom-right
+            x0, y0, 0.0, 0.0,  # top-left
+            x1, y0, 1.0, 0.0,  # top-right
         )
 
-        # mpv may leave GL state changed; put it in a known-good state for overlays
-        GL.glDisable(GL_SCISSOR_TEST)
-        GL.glDisable(GL_DEPTH_TEST)
-        GL.glDisable(GL_CULL_FACE)
-        GL.glEnable(GL_BLEND)
-        GL.glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        if set_state:
+            set_overlay_gl_state()
 
         GL.glUseProgram(self.prog)
 
@@ -185,6 +267,15 @@ class GLOverlayQuad:
         GL.glDrawArrays(GL_TRIANGLE_STRIP, 0, 4)
 
 
+def set_overlay_gl_state() -> None:
+    """mpv may leave GL state changed; put it in a known-good state for overlays."""
+    GL.glDisable(GL_SCISSOR_TEST)
+    GL.glDisable(GL_DEPTH_TEST)
+    GL.glDisable(GL_CULL_FACE)
+    GL.glEnable(GL_BLEND)
+    GL.glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+
 def make_text_overlay(font: pygame.font.Font, text: str) -> pygame.Surface:
     pad = 16
     fg = (255, 255, 255)
@@ -192,7 +283,7 @@ def make_text_overlay(font: pygame.font.Font, text: str) -> pygame.Surface:
 
     text_s = font.render(text, True, fg)
     w, h = text_s.get_width() + pad * 2, text_s.get_height() + pad * 2
-    surf = pygame.Surface((w, h), pygame.SRCALPHA, 32).convert_alpha()
+    surf = make_rgba_surface(w, h)
     surf.fill((0, 0, 0, 0))
     pygame.draw.rect(surf, bg, surf.get_rect(), border_radius=14)
     surf.blit(text_s, (pad, pad))
@@ -203,7 +294,7 @@ def make_volume_overlay(font: pygame.font.Font, vol: int) -> pygame.Surface:
     # vol is 0..100
     w, h = 360, 70
     pad = 12
-    surf = pygame.Surface((w, h), pygame.SRCALPHA, 32).convert_alpha()
+    surf = make_rgba_surface(w, h)
     surf.fill((0, 0, 0, 0))
 
     pygame.draw.rect(surf, (0, 0, 0, 160), surf.get_rect(), border_radius=16)
@@ -262,13 +353,13 @@ class GLMenuRenderer:
         self.loc_tex = GL.glGetUniformLocation(self.prog, b"u_tex")
 
         # Fullscreen quad (triangle strip): pos(x,y), uv(u,v)
-        # Note: UV assumes surface bytes are "RGBA" with top-left origin;
-        # we flip the Y in the bytes conversion to match GL's bottom-left.
+        # Note: texture rows are uploaded top-down as the surface stores them
+        # (no flip), so v=0 is the top edge of the screen.
         verts = (ctypes.c_float * 16)(
-            -1.0, -1.0, 0.0, 0.0,
-            1.0, -1.0, 1.0, 0.0,
-            -1.0, 1.0, 0.0, 1.0,
-            1.0, 1.0, 1.0, 1.0,
+            -1.0, -1.0, 0.0, 1.0,
+            1.0, -1.0, 1.0, 1.0,
+            -1.0, 1.0, 0.0, 0.0,
+            1.0, 1.0, 1.0, 0.0,
         )
 
         vbo = ctypes.c_uint(0)
@@ -301,9 +392,11 @@ class GLMenuRenderer:
 
     def update_from_surface(self, surf: pygame.Surface) -> None:
         """Upload pygame surface pixels into the GL texture."""
-        # Convert surface to RGBA bytes; flip vertically so it appears correctly.
-        rgba = pygame.image.tostring(surf, "RGBA", True)
-        buf = ctypes.create_string_buffer(rgba)
+        assert surf.get_bytesize() == 4 and surf.get_size() == (self.w, self.h), \
+            f"menu surface must be {self.w}x{self.h} 32-bit, got {surf.get_size()} {surf.get_bitsize()}-bit"
+
+        # In place for the RGBA-ordered surface Display allocates; copied otherwise.
+        buf = surface_pixels(surf)
 
         GL.glActiveTexture(GL_TEXTURE0)
         GL.glBindTexture(GL_TEXTURE_2D, self.tex)
@@ -343,7 +436,7 @@ class OverlaySlot:
     content_key: Optional[Tuple] = None
 
     def set_visible_for(self, seconds: float) -> bool:
-        new_expires = time.time() + seconds
+        new_expires = time.monotonic() + seconds
         # abs(... ) > 1e-3 avoids "always changed" due to tiny float differences
         changed = (not self.visible) or (self.expires_at is None) or (abs(self.expires_at - new_expires) > 1e-3)
         self.visible = True
@@ -391,6 +484,7 @@ class OverlayManager:
         self._make_text = make_text
         self._make_volume = make_volume
         self._dirty = False
+        self._next_expiry = math.inf  # Earliest slot expires_at; tick() is a no-op before this
 
         # Slots
         self.channel = OverlaySlot(
@@ -435,6 +529,7 @@ class OverlayManager:
 
         dirty = changed or vis_changed
         self._dirty |= dirty
+        self._reschedule()
         return dirty
 
     def bump_volume(self, vol: int, *, seconds: float = 1.2) -> None:
@@ -449,6 +544,7 @@ class OverlayManager:
             self.volume.content_key = key
 
         self.volume.set_visible_for(seconds)
+        self._reschedule()
 
         self._dirty = True
 
@@ -457,34 +553,39 @@ class OverlayManager:
         self._dirty = False
         return dirty
 
+    @property
+    def next_expiry(self) -> float:
+        """Time (time.monotonic() clock) at which tick() next has work to do; inf if never."""
+        return self._next_expiry
+
+    def _reschedule(self) -> None:
+        self._next_expiry = min(
+            (s.expires_at for s in (self.channel, self.volume) if s.expires_at is not None),
+            default=math.inf,
+        )
+
     # ---- per-frame ----
 
-    def tick(self) -> None:
-        now = time.time()
+    def tick(self, now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.monotonic()
         changed = False
         changed |= self.channel.tick(now)
         changed |= self.volume.tick(now)
 
         self._dirty |= changed
+        self._reschedule()
 
     def draw(self) -> None:
         # Draw in your preferred order (channel first, then volume on top)
-        if self.channel.visible:
-            self.channel.quad.draw(self.channel.x, self.channel.y)
-        if self.volume.visible:
-            self.volume.quad.draw(self.volume.x, self.volume.y)
-
-
-# ----------------------------
-# Demo: Toggle MENU <-> VIDEO on Event.PRESS
-# ----------------------------
+        slots = [s for s in (self.channel, self.volume) if s.visible]
+        if not slots:
+            return
 
-def draw_menu_surface(surf: pygame.Surface, font: pygame.font.Font, subtitle: str) -> None:
-    surf.fill((20, 20, 20, 255))
-    title = font.render("FPTV MENU", True, (255, 255, 255))
-    surf.blit(title, (40, 40))
-    sub = font.render(subtitle, True, (200, 200, 200))
-    surf.blit(sub, (40, 140))
+        # Reset GL state once for the whole batch rather than once per quad.
+        set_overlay_gl_state()
+        for slot in slots:
+            slot.quad.draw(slot.x, slot.y, set_state=False)
 
 
 def init_viewport(w: int, h: int) -> None:
@@ -511,8 +612,8 @@ def draw_main_menu(
     surface.fill(BG_NORM)
 
     # Title: "FP" in yellow, "TV" in blue
-    text_fp = title_font.render("FP", True, FG_ACCENT_YELLOW)
-    text_tv = title_font.render("TV", True, FG_ACCENT_BLUE)
+    text_fp = render_text(title_font, "FP", FG_ACCENT_YELLOW)
+    text_tv = render_text(title_font, "TV", FG_ACCENT_BLUE)
     x, y = 60, 40
     surface.blit(text_fp, (x, y))
     surface.blit(text_tv, (x + text_fp.get_width(), y))
@@ -522,18 +623,18 @@ def draw_main_menu(
     line_h = 70
     pad_x = 60
 
+    blits = []  # Submitted in one Surface.blits() call after the loop
     for i, text in enumerate(items):
         is_sel = (i == selected)
-        bg_color = BG_SEL if is_sel else BG_NORM
         fg_color = FG_SEL if is_sel else FG_NORM
 
         item_y = start_y + i * line_h
-        rect = pygame.Rect(0, item_y, surface.get_width(), line_h)
-        pygame.draw.rect(surface, bg_color, rect)
+        if is_sel:  # Other rows keep the BG_NORM from the initial fill
+            surface.fill(BG_SEL, (0, item_y, surface.get_width(), line_h))
 
-        text_surf = item_font.render(text, True, fg_color)
-        text_rect = text_surf.get_rect(midleft=(pad_x, item_y + line_h // 2))
-        surface.blit(text_surf, text_rect)
+        text_surf = render_text(item_font, text, fg_color)
+        blits.append((text_surf, text_surf.get_rect(midleft=(pad_x, item_y + line_h // 2))))
+    surface.blits(blits, doreturn=False)
 
 
 def draw_subscreen_header(
@@ -559,18 +660,17 @@ def draw_subscreen_header(
 
     # Background for header when Back is selected
     if back_selected:
-        rect = pygame.Rect(0, 0, surface.get_width(), header_h)
-        pygame.draw.rect(surface, BG_SEL, rect)
+        surface.fill(BG_SEL, (0, 0, surface.get_width(), header_h))
 
     # Back button (left)
     back_fg = FG_SEL if back_selected else FG_ACCENT_BLUE
-    back_text = font.render("< Back", True, back_fg)
+    back_text = render_text(font, "< Back", back_fg)
     back_rect = back_text.get_rect(midleft=(pad_x, header_h // 2))
     surface.blit(back_text, back_rect)
 
     # Title (right, white)
     if title:
-        title_text = font.render(title, True, FG_NORM)
+        title_text = render_text(font, title, FG_NORM)
         title_rect = title_text.get_rect(midright=(surface.get_width() - pad_x, header_h // 2))
         surface.blit(title_text, title_rect)
 
@@ -582,8 +682,10 @@ def draw_browse(
         item_font: pygame.font.Font,
         channels: list,  # List[Channel]
         selected: int,  # -1 = Back selected, 0+ = channel index
-        epg_map: dict = None,  # Optional: {channel_name: EPGEvent}
+        channel_epg: list = None,  # Optional: EPGEvent or None per channel, aligned with channels
         epg_font: pygame.font.Font = None,  # Smaller font for EPG titles
+        loading: bool = False,  # Channel list not fetched yet
+        error: str | None = None,  # Why the last fetch failed ("Retrying…" underneath while loading)
 ) -> None:
     """Draw the channel browser with scrolling list. selected=-1 means Back."""
     surface.fill(BG_NORM)
@@ -592,9 +694,18 @@ def draw_browse(
     header_h = draw_subscreen_header(surface, item_font, back_selected=(selected == -1), title="Channels")
 
     if not channels:
-        # No channels message
-        msg = item_font.render("No channels found", True, FG_ALERT)
-        msg_rect = msg.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2))
+        # No channels message (or placeholder while the playlist is still loading)
+        cx, cy = surface.get_width() // 2, surface.get_height() // 2
+        if error:
+            msg = render_text(item_font, error, FG_ALERT)
+            if loading:
+                sub = render_text(epg_font or item_font, "Retrying…", FG_INACT)
+                surface.blit(sub, sub.get_rect(midtop=(cx, cy + msg.get_height() // 2 + 10)))
+        elif loading:
+            msg = render_text(item_font, "Loading…", FG_NORM)
+        else:
+            msg = render_text(item_font, "No channels found", FG_ALERT)
+        msg_rect = msg.get_rect(center=(cx, cy))
         surface.blit(msg, msg_rect)
         return
 
@@ -624,26 +735,25 @@ def draw_browse(
     epg_max_width = w - epg_x - pad_x  # Max width for EPG text
 
     y0 = header_h
+    blits = []  # Row text, submitted in one Surface.blits() call after the loop
     for row, idx in enumerate(range(start, end)):
         channel = channels[idx]
         is_sel = (idx == selected)  # Only highlight if this channel is selected (not Back)
         fg_color = FG_SEL if is_sel else FG_NORM
-        bg_color = BG_SEL if is_sel else BG_NORM
         epg_fg = FG_SEL if is_sel else FG_INACT  # Dimmer color for EPG when not selected
 
         item_y = y0 + row * line_h
-        rect = pygame.Rect(0, item_y, w, line_h)
-        pygame.draw.rect(surface, bg_color, rect)
+        if is_sel:  # Other rows keep the BG_NORM from the initial fill
+            surface.fill(BG_SEL, (0, item_y, w, line_h))
 
         # Channel name (left side)
-        text_surf = item_font.render(channel.name, True, fg_color)
+        text_surf = render_text(item_font, channel.name, fg_color)
         text_rect = text_surf.get_rect(midleft=(pad_x, item_y + line_h // 2))
-        surface.blit(text_surf, text_rect)
+        blits.append((text_surf, text_rect))
 
         # EPG program title (right side, if available)
-        # EPG map is keyed by channel name (not UUID)
-        if epg_map:
-            epg_event = epg_map.get(channel.name)
+        if channel_epg:
+            epg_event = channel_epg[idx]
             if epg_event and epg_event.title:
                 title = epg_event.title
                 font = epg_font or item_font
@@ -656,18 +766,14 @@ def draw_browse(
                 if available_width < 50:
                     continue
 
-                # Truncate if too long
-                epg_surf = font.render(title, True, epg_fg)
-                if epg_surf.get_width() > available_width:
-                    # Truncate with ellipsis
-                    while title and epg_surf.get_width() > available_width:
-                        title = title[:-1]
-                        epg_surf = font.render(title + "...", True, epg_fg)
-                    title = title + "..." if title else ""
-                    epg_surf = font.render(title, True, epg_fg)
+                # Truncate with ellipsis if too long
+                title = fit_text(font, title, available_width)
+                if not title:
+                    continue
+                epg_surf = render_text(font, title, epg_fg)
+                blits.append((epg_surf, epg_surf.get_rect(midleft=(epg_start_x, item_y + line_h // 2))))
 
-                epg_rect = epg_surf.get_rect(midleft=(epg_start_x, item_y + line_h // 2))
-                surface.blit(epg_surf, epg_rect)
+    surface.blits(blits, doreturn=False)
 
 
 def draw_about(
@@ -689,8 +795,8 @@ def draw_about(
 
     for key, value in info.items():
         # Key in dim color, value in bright
-        key_surf = item_font.render(f"{key}:", True, FG_INACT)
-        val_surf = item_font.render(value, True, FG_NORM)
+        key_surf = render_text(item_font, f"{key}:", FG_INACT)
+        val_surf = render_text(item_font, value, FG_NORM)
 
         surface.blit(key_surf, (40, y))
         surface.blit(val_surf, (40 + key_surf.get_width() + 20, y))
@@ -710,104 +816,6 @@ def draw_scan(
     # Header with Back and title
     header_h = draw_subscreen_header(surface, item_font, back_selected=back_selected, title="Scan")
 
-    msg = item_font.render(status, True, FG_NORM)
+    msg = render_text(item_font, status, FG_NORM)
     msg_rect = msg.get_rect(center=(surface.get_width() // 2, (surface.get_height() + header_h) // 2))
     surface.blit(msg, msg_rect)
-
-
-# -----------------------------------------------------------------------------
-# Legacy/reference code (commented)
-# -----------------------------------------------------------------------------
-
-"""
-def draw_menu(surface, title_font, item_font,
-              items: List[str], selected: int):
-    surface.fill((0, 0, 0))
-    text_fp = title_font.render("FP", True, FG_ACCENT_YELLOW)
-    text_tv = title_font.render("TV", True, FG_ACCENT_BLUE)
-    x, y = 60, 60
-    surface.blit(text_fp, (x, y))
-    surface.blit(text_tv, (x + text_fp.get_width(), y))
-
-    start_y = 200
-    line_h = 70
-    line_w = surface.get_width()
-
-    for i, text in enumerate(items):
-        is_sel = (i == selected)
-        bg_color = BG_SEL if is_sel else BG_NORM
-        fg_color = FG_SEL if is_sel else FG_NORM
-
-        y = start_y + i * line_h
-        rect = pygame.Rect(x, y, line_w, line_h)
-        pygame.draw.rect(surface, bg_color, rect)
-
-        text_surf = item_font.render(text, True, fg_color)
-        text_rect = text_surf.get_rect()
-        text_rect.midleft = (x, y + line_h // 2)
-
-        surface.blit(text_surf, text_rect)
-
-
-def draw_browse(surface, item_font,
-                channels: List[Channel], selected: int):
-    surface.fill(BG_NORM)
-    header = "Back"
-    fg_color = BG_SEL if selected == -1 else FG_NORM
-    bg_color = BG_NORM
-
-    img = item_font.render(header, True, fg_color, bg_color)
-    surface.blit(img, (20, 0))
-
-    if not channels:
-        draw_centered_text(
-            surface, item_font, "No channels", surface.get_height() // 2,
-            color=FG_ALERT)
-        return
-
-    # Show a window around selection
-    h = surface.get_height()
-    visible = max(5, (h - 148) // 52)
-    half = visible // 2
-    start = max(0, selected - half)
-    end = min(len(channels), start + visible)
-    start = max(0, end - visible)
-
-    y0 = 130
-    line_h = 52
-    line_w = surface.get_width()
-    for row, idx in enumerate(range(start, end)):
-        text = channels[idx].name
-        is_sel = (idx == selected)
-        fg_color = FG_SEL if is_sel else FG_NORM
-        bg_color = BG_SEL if is_sel else BG_NORM
-        y = y0 + row * line_h
-        rect = pygame.Rect(0, y, line_w, line_h)
-        pygame.draw.rect(surface, bg_color, rect)
-        text_surf = item_font.render(text, True, fg_color)
-        text_rect = text_surf.get_rect()
-        text_rect.midleft = (20, y + line_h // 2)
-        surface.blit(text_surf, text_rect)
-
-
-def draw_playing(surface, title_font, item_font, small_font, name: str):
-    surface.fill((0, 0, 0))
-    img = small_font.render("Press to stop and return", True, FG_NORM)
-    surface.blit(img, (20, 20))
-    draw_centered_text(surface, title_font, "Playing", 90)
-    draw_centered_text(surface, item_font, name, 190)
-
-
-def draw_escaping(surface, large_font, small_font):
-    surface.fill((0, 0, 0))
-    text_title = large_font.render("Escape the Package!", True, FG_ALERT)
-    surface.blit(text_title, (20, 20))
-    msg = small_font.render("If you're confused, press the power button.", True, FG_NORM)
-    surface.blit(msg, (20, 100))
-
-
-def draw_centered_text(surface, font, text, y, color=FG_NORM):
-    img = font.render(text, True, color)
-    r = img.get_rect(center=(surface.get_width() // 2, y))
-    surface.blit(img, r)
-"""
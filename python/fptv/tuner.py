@@ -11,7 +11,6 @@ Encapsulates:
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
-from queue import Empty
 from typing import TYPE_CHECKING
 
 from fptv.log import Logger
@@ -199,7 +198,7 @@ class Tuner:
             return False
         return self._mpv.maybe_render(width, height)
 
-    def tick(self, did_render_frame: bool = False) -> TunerStatus:
+    def tick(self, did_render_frame: bool = False, now: float | None = None) -> TunerStatus:
         """
         Tick the tuner state machine and process pending commands.
 
@@ -207,18 +206,22 @@ class Tuner:
 
         Args:
             did_render_frame: True if render_frame() returned True this tick
+            now: Frame timestamp from time.monotonic(); read here if omitted
 
         Returns:
             TunerStatus with current state and any message for display.
         """
+        if now is None:
+            now = time.monotonic()
+
         if self._mpv:
-            self._mpv.tick()  # process pending mpv commands
+            self._mpv.tick(now)  # process pending mpv commands
 
         # Process watchdog actions
         self._process_watchdog()
 
         # Run state machine
-        return self._tick_state(did_render_frame)
+        return self._tick_state(did_render_frame, now)
 
     def report_swap(self) -> None:
         """Notify mpv that a buffer swap occurred. Call after pygame.display.flip()."""
@@ -237,7 +240,7 @@ class Tuner:
         """
         self._pending_url = url
         self._pending_name = name
-        self._debounce_deadline = time.time() + self._debounce_s
+        self._debounce_deadline = time.monotonic() + self._debounce_s
         self._status_message = None
 
     def tune_now(self, url: str, name: str = "") -> None:
@@ -268,7 +271,7 @@ class Tuner:
         self.log.out(f"Reload: {reason}")
         self._mpv.stop()
         self._mpv.loadfile_now(self._current_url)
-        self._tune_started_at = time.time()
+        self._tune_started_at = time.monotonic()
         self._tune_attempts = 0
         self._state = TunerState.TUNING
 
@@ -289,26 +292,23 @@ class Tuner:
         )
 
         # Drain and process watchdog actions
-        while True:
-            try:
-                action, url, reason = self._watchdog.actions.get_nowait()
-            except Empty:
-                break
-
+        actions = self._watchdog.actions
+        while actions:
+            action, url, reason = actions.popleft()
             if action == "reload" and url:
                 self.reload(reason)
 
-    def _tick_state(self, did_render_frame: bool) -> TunerStatus:
+    def _tick_state(self, did_render_frame: bool, now: float) -> TunerStatus:
         """
         Internal: tick the tune state machine.
 
         Args:
             did_render_frame: True if mpv rendered a new frame this tick
+            now: Frame timestamp from time.monotonic()
 
         Returns:
             TuneStatus with current state and any message for overlay display
         """
-        now = time.time()
         self._status_message = None
 
         # --- Check for pending debounced tune ---
@@ -350,7 +350,7 @@ class Tuner:
         """Actually start the tune."""
         self._current_url = url
         self._current_name = name
-        self._tune_started_at = time.time()
+        self._tune_started_at = time.monotonic()
         self._tune_attempts = 0
         self._state = TunerState.TUNING
 
@@ -41,10 +41,11 @@ import json
 import os
 import random
 import re
+import sys
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from queue import SimpleQueue
 from typing import Callable, Iterable, Optional, List, Set, Any
 
 import requests
@@ -63,6 +64,10 @@ SETTLE_AFTER_DISABLE_SECS = 0.5  # After disabling failed muxes
 SETTLE_AFTER_MAPPING_SECS = 1.0  # After service-to-channel mapping
 SETTLE_AFTER_PRUNE_SECS = 1.0  # After pruning/cleanup to avoid retune flakiness
 
+# Watchdog: minimum pause after each subscriptions poll, even when the poll itself
+# overran the interval, so a slow TVHeadend isn't polled back-to-back.
+WATCHDOG_MIN_GAP_S = 0.05
+
 
 @dataclass(frozen=True)
 class Channel:
@@ -1104,22 +1109,18 @@ class TVHeadendScanner:
                             deleted += 1
         return deleted
 
-    def get_playlist_channels(self) -> List[Channel]:
+    def fetch_playlist_channels(self) -> List[Channel]:
         """
         tvheadend's /playlist/channels returns an m3u file.
         Lines look like:
 
             #EXTINF:-1 tvg-id="26e30b9fb6fb20429aac61784fb50ed4" tvg-chno="9.1",KQED-HD
             http://localhost:9981/stream/channelid/520872742?profile=pass
+
+        Raises requests.exceptions.RequestException if TVHeadend can't be reached,
+        or ValueError if the playlist is malformed.
         """
-        try:
-            resp = self._get("/playlist/channels")
-        except requests.exceptions.RequestException as e:
-            self.log.err(f"get_playlist_channels: {e}")
-            return []
-        except ValueError as e:
-            self.log.err(f"get_playlist_channels: {e}")
-            return []
+        resp = self._get("/playlist/channels")
 
         channels = []
         name = None
@@ -1145,7 +1146,9 @@ class TVHeadendScanner:
             elif line.startswith('http://'):
                 if name is None:
                     raise ValueError(f"No name found before url: {line}")
-                channels.append(Channel(name, line, uuid))
+                # Interned: the same name keys the text cache and EPG map lookups,
+                # so those compare by identity before falling back to string compare.
+                channels.append(Channel(sys.intern(name), line, uuid))
                 name = None
                 uuid = ""
 
@@ -1182,7 +1185,7 @@ class TVHeadendScanner:
 
         for entry in entries:
             # Key by channel name since tvg-id != channelUuid in TVHeadend
-            channel_name = entry.get("channelName") or ""
+            channel_name = sys.intern(entry.get("channelName") or "")
             channel_uuid = entry.get("channelUuid") or ""
             if not channel_name:
                 continue
@@ -1829,7 +1832,7 @@ class WatchdogState:
     """Explicit state shared between main thread and watchdog thread."""
     expecting: bool = False
     current_url: str | None = None
-    tuning_started_at: float = 0.0
+    tuning_started_at: float = 0.0  # time.monotonic()
 
 
 class WatchdogWorker:
@@ -1838,7 +1841,10 @@ class WatchdogWorker:
         self.tvh = tvh
         self.ua_tag = ua_tag
         self.interval_s = interval_s
-        self.actions = SimpleQueue()  # ("reload", url, reason)
+        # ("reload", url, reason). Single producer (this thread), single consumer
+        # (main loop); deque append/popleft are atomic, so no lock is needed.
+        # Bounded so a stalled main loop can't grow it; the oldest entries go first.
+        self.actions: deque[tuple[str, str, str]] = deque(maxlen=8)
         self._stop = threading.Event()
         self._thread = threading.Thread(target=self._run, name="tvh-watchdog", daemon=True)
 
@@ -1875,13 +1881,30 @@ class WatchdogWorker:
                 return e
         return None
 
+    def _sleep_until(self, deadline: float, min_wait: float = WATCHDOG_MIN_GAP_S) -> bool:
+        """
+        Wait until a time.monotonic() deadline, but at least min_wait seconds.
+
+        Returns True if stop was requested.
+        """
+        return self._stop.wait(max(min_wait, deadline - time.monotonic()))
+
     def _run(self):
+        next_poll = time.monotonic()
         while not self._stop.is_set():
-            now = time.time()
+            # Monotonic for our own timers so wall-clock steps (NTP at boot) can't
+            # trigger or suppress reloads; TVH reports subscription start in epoch time.
+            now = time.monotonic()
+
+            # Schedule from the previous deadline, not from after the HTTP round-trip,
+            # so the cadence doesn't drift. If we fell behind, poll now and realign.
+            next_poll = max(next_poll + self.interval_s, now)
+
             try:
                 subs = self.tvh.subscriptions()
             except Exception:
-                if self._stop.wait(self.interval_s):
+                # Back off a full interval after an error, however late this poll ran.
+                if self._sleep_until(next_poll, self.interval_s):
                     break  # Stop requested during wait
                 continue
 
@@ -1908,7 +1931,7 @@ class WatchdogWorker:
                         self._last_fix = now
                         self._bad_since = now
                         self._log.out("Triggering reload: missing_subscription")
-                        self.actions.put(("reload", current_url, "missing_subscription"))
+                        self.actions.append(("reload", current_url, "missing_subscription"))
                         took_action = True
                 else:
                     state = (ours.get("state") or "")
@@ -1916,7 +1939,7 @@ class WatchdogWorker:
                     rate_in = int(ours.get("in") or 0)
                     rate_out = int(ours.get("out") or 0)
                     started = int(ours.get("start") or 0)
-                    age = now - started if started else 0.0
+                    age = time.time() - started if started else 0.0
 
                     looks_stuck = (
                             state.lower() == "bad"
@@ -1937,10 +1960,12 @@ class WatchdogWorker:
                             self._bad_since = now
                             reason = f"stuck:{state}:{errs}:{rate_in}/{rate_out}"
                             self._log.out(f"Triggering reload: {reason}")
-                            self.actions.put(("reload", current_url, reason))
+                            self.actions.append(("reload", current_url, reason))
                             took_action = True
 
-            self._stop.wait(self.interval_s if not took_action else 0.1)
+            if took_action:
+                next_poll = now + 0.1  # Re-check soon after a reload
+            self._sleep_until(next_poll)
 
 
 def main():